@@ -4,28 +4,35 @@ Simple extraction example - PostCrawl SDK 101
 """
 
 import asyncio
+import io
 import os
-
-# Load environment variables from .env file
-from dotenv import load_dotenv
+import sys
 
 from postcrawl import PostCrawlClient, RedditPost, TiktokPost
 
-load_dotenv()
 
+def get_api_key() -> str:
+    """Read the API key, loading .env only if it isn't already set."""
+    if "POSTCRAWL_API_KEY" not in os.environ:
+        try:
+            from dotenv import load_dotenv
 
-API_KEY = os.getenv("POSTCRAWL_API_KEY", "sk_your_api_key_here")
+            load_dotenv()
+        except ImportError:
+            pass
 
-if not API_KEY or API_KEY == "sk_your_api_key_here":
-    print("❌ Error: POSTCRAWL_API_KEY environment variable is not set.")
-    print("Please set it in your .env file or environment.")
-    exit(1)
+    api_key = os.getenv("POSTCRAWL_API_KEY")
+    if not api_key or api_key == "sk_your_api_key_here":
+        raise SystemExit(
+            "❌ Error: POSTCRAWL_API_KEY environment variable is not set.\n"
+            "Please set it in your .env file or environment."
+        )
+    return api_key
 
 
 async def main():
     """Simple extraction example."""
-    # Create client
-    client = PostCrawlClient(api_key=API_KEY)
+    api_key = get_api_key()
 
     # Extract content from URLs
     urls = [
@@ -33,38 +40,50 @@ async def main():
         "https://www.tiktok.com/@britacooks/video/7397065165805473054",
     ]
 
-    print(f"Extracting content from {len(urls)} URLs...")
-    results = await client.extract(urls=urls, include_comments=False)
+    # Create client - the context manager reuses one connection pool and closes it on exit
+    async with PostCrawlClient(api_key=api_key) as client:
+        print(f"Extracting content from {len(urls)} URLs...")
+
+        # URLs are sent in batches of 10; posts are printed as each batch completes
+        count = 0
+        async for post in client.extract_stream(urls=urls, batch_size=10):
+            count += 1
+            # Each post is of type ExtractedPost; build its output and write it in one go
+            buf = io.StringIO()
+            print(f"\n--- Result {count} ---", file=buf)
+            print(f"URL: {post.url}", file=buf)
+            print(f"Platform: {post.source}", file=buf)
+
+            if post.error:
+                print(f"Error: {post.error}", file=buf)
+            elif isinstance(post.raw, RedditPost):
+                print(f"Title: {post.raw.title}", file=buf)
+                print(f"Subreddit: r/{post.raw.subreddit_name}", file=buf)
+                print(f"Score: {post.raw.score}", file=buf)
+            elif isinstance(post.raw, TiktokPost):
+                print(f"Username: @{post.raw.username}", file=buf)
+                print(f"Description: {post.preview}", file=buf)
+                print(f"Likes: {post.raw.likes}", file=buf)
+            sys.stdout.write(buf.getvalue())
 
     # Check if we got fewer results than URLs (some might be filtered)
-    if len(results) < len(urls):
-        print(f"⚠️  Note: API returned {len(results)} results for {len(urls)} URLs")
-        print("    (Some URLs may have been filtered or failed)\n")
-
-    # Print results - each post is of type ExtractedPost
-    for i, post in enumerate(results, 1):
-        print(f"\n--- Result {i} ---")
-        print(f"URL: {post.url}")
-        print(f"Platform: {post.source}")
-
-        if post.error:
-            print(f"Error: {post.error}")
-        elif post.raw and isinstance(post.raw, RedditPost):
-            print(f"Title: {post.raw.title}")
-            print(f"Subreddit: r/{post.raw.subreddit_name}")
-            print(f"Score: {post.raw.score}")
-        elif post.raw and isinstance(post.raw, TiktokPost):
-            print(f"Username: @{post.raw.username}")
-            print(f"Description: {post.raw.description[:80]}...")
-            print(f"Likes: {post.raw.likes}")
+    if count < len(urls):
+        print(f"\n⚠️  Note: API returned {count} results for {len(urls)} URLs")
+        print("    (Some URLs may have been filtered or failed)")
 
     # Summary
-    if results:
+    if count:
         print(f"\n{'=' * 50}")
-        print(f"✅ Successfully extracted {len(results)} posts")
+        print(f"✅ Successfully extracted {count} posts")
     else:
         print("\n⚠️  No results returned")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when installed (pip install "postcrawl[fast]")
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
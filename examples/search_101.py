@@ -4,51 +4,70 @@ Simple search example - PostCrawl SDK 101
 """
 
 import asyncio
+import io
 import os
-
-# Load environment variables from .env file
-from dotenv import load_dotenv
+import sys
 
 from postcrawl import PostCrawlClient
 
-load_dotenv()
 
+def get_api_key() -> str:
+    """Read the API key, loading .env only if it isn't already set."""
+    if "POSTCRAWL_API_KEY" not in os.environ:
+        try:
+            from dotenv import load_dotenv
 
-API_KEY = os.getenv("POSTCRAWL_API_KEY", "sk_your_api_key_here")
+            load_dotenv()
+        except ImportError:
+            pass
 
-if not API_KEY or API_KEY == "sk_your_api_key_here":
-    print("❌ Error: POSTCRAWL_API_KEY environment variable is not set.")
-    print("Please set it in your .env file or environment.")
-    exit(1)
+    api_key = os.getenv("POSTCRAWL_API_KEY")
+    if not api_key or api_key == "sk_your_api_key_here":
+        raise SystemExit(
+            "❌ Error: POSTCRAWL_API_KEY environment variable is not set.\n"
+            "Please set it in your .env file or environment."
+        )
+    return api_key
 
 
 async def main():
     """Simple search example."""
-    # Create client
-    client = PostCrawlClient(api_key=API_KEY)
-
-    # Search Reddit
-    results = await client.search(
-        social_platforms=["reddit", "tiktok"],
-        query="python",
-        results=5,
-        page=1,
-    )
-
-    # Print results with proper type annotations
-    print(f"Found {len(results)} posts:")
+    api_key = get_api_key()
+
+    # Create client - the context manager reuses one connection pool and closes it on exit
+    async with PostCrawlClient(api_key=api_key) as client:
+        # Search Reddit
+        results = await client.search(
+            social_platforms=["reddit", "tiktok"],
+            query="python",
+            results=5,
+            page=1,
+        )
+
+    # Print results with proper type annotations, collected in a buffer and written once
+    buf = io.StringIO()
+    print(f"Found {len(results)} posts:", file=buf)
     for post in results:  # post is of type SearchResult
-        print(f"\n- {post.title}")
-        print(f"  URL: {post.url}")
-        print(f"  Date: {post.date}")
+        print(f"\n- {post.title}", file=buf)
+        print(f"  URL: {post.url}", file=buf)
+        print(f"  Date: {post.date}", file=buf)
         print(
             f"  Snippet: {post.snippet[:100]}..."
             if len(post.snippet) > 100
-            else f"  Snippet: {post.snippet}"
+            else f"  Snippet: {post.snippet}",
+            file=buf,
         )
         if post.image_url:
-            print(f"  Image: {post.image_url}")
+            print(f"  Image: {post.image_url}", file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when installed (pip install "postcrawl[fast]")
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,91 +4,109 @@ Simple search and extract example - PostCrawl SDK 101
 """
 
 import asyncio
+import io
 import os
-
-# Load environment variables from .env file
-from dotenv import load_dotenv
+import sys
 
 from postcrawl import PostCrawlClient, RedditPost, TiktokPost
 
-load_dotenv()
 
+def get_api_key() -> str:
+    """Read the API key, loading .env only if it isn't already set."""
+    if "POSTCRAWL_API_KEY" not in os.environ:
+        try:
+            from dotenv import load_dotenv
 
-API_KEY = os.getenv("POSTCRAWL_API_KEY", "sk_your_api_key_here")
+            load_dotenv()
+        except ImportError:
+            pass
 
-if not API_KEY or API_KEY == "sk_your_api_key_here":
-    print("❌ Error: POSTCRAWL_API_KEY environment variable is not set.")
-    print("Please set it in your .env file or environment.")
-    exit(1)
+    api_key = os.getenv("POSTCRAWL_API_KEY")
+    if not api_key or api_key == "sk_your_api_key_here":
+        raise SystemExit(
+            "❌ Error: POSTCRAWL_API_KEY environment variable is not set.\n"
+            "Please set it in your .env file or environment."
+        )
+    return api_key
 
 
 async def main():
     """Simple search and extract example."""
-    # Create client
-    client = PostCrawlClient(api_key=API_KEY)
-
-    # Search and extract Reddit posts in one operation
-    results = await client.search_and_extract(
-        social_platforms=["reddit", "tiktok"],
-        query="algorithms",
-        results=3,
-        page=1,
-        include_comments=True,  # Extract comments too
-        response_mode="raw",  # Get full post data
-    )
-
-    # Print results - each post is of type ExtractedPost
-    print(f"Found and extracted {len(results)} posts:")
+    api_key = get_api_key()
+
+    # Create client - the context manager reuses one connection pool and closes it on exit
+    async with PostCrawlClient(api_key=api_key) as client:
+        # Search and extract Reddit posts in one operation
+        results = await client.search_and_extract(
+            social_platforms=["reddit", "tiktok"],
+            query="algorithms",
+            results=3,
+            page=1,
+            include_comments=True,  # Extract comments too
+            response_mode="raw",  # Get full post data
+        )
+
+    # Print results - each post is of type ExtractedPost. Output is collected in a
+    # buffer and written once instead of calling print() per line.
+    buf = io.StringIO()
+    print(f"Found and extracted {len(results)} posts:", file=buf)
     for i, post in enumerate(results, 1):
-        print(f"\n{i}. {post.url}")
+        print(f"\n{i}. {post.url}", file=buf)
 
         if post.error:
-            print(f"   ❌ Error: {post.error}")
+            print(f"   ❌ Error: {post.error}", file=buf)
         elif post.raw:
-            # Handle different platform types
+            # Handle different platform types; check raw itself, since it can be
+            # the other platform's model when it doesn't validate against source
             if isinstance(post.raw, RedditPost):
                 # Reddit-specific fields
-                print(f"   ✓ Title: {post.raw.title}")
-                print(f"   ✓ Score: {post.raw.score}")
-                print(f"   ✓ Subreddit: r/{post.raw.subreddit_name}")
+                print(f"   ✓ Title: {post.raw.title}", file=buf)
+                print(f"   ✓ Score: {post.raw.score}", file=buf)
+                print(f"   ✓ Subreddit: r/{post.raw.subreddit_name}", file=buf)
 
                 # Show content preview
-                if post.raw.description:
-                    preview = post.raw.description[:150]
-                    print(f"   📄 Content: {preview}...")
+                if post.preview:
+                    print(f"   📄 Content: {post.preview}", file=buf)
 
                 # Show comments if included
                 if post.raw.comments:
-                    print(f"   💬 {len(post.raw.comments)} comments")
+                    print(f"   💬 {len(post.raw.comments)} comments", file=buf)
                     # Show first comment
                     if post.raw.comments:
                         comment = post.raw.comments[0]
                         comment_preview = comment.text[:100]
-                        print(f"      └─ {comment_preview}...")
+                        print(f"      └─ {comment_preview}...", file=buf)
 
             elif isinstance(post.raw, TiktokPost):
                 # TikTok-specific fields
-                print(f"   ✓ Username: @{post.raw.username}")
-                print(f"   ✓ Likes: {post.raw.likes}")
+                print(f"   ✓ Username: @{post.raw.username}", file=buf)
+                print(f"   ✓ Likes: {post.raw.likes}", file=buf)
 
                 # Show description
-                if post.raw.description:
-                    preview = post.raw.description[:150]
-                    print(f"   📄 Description: {preview}...")
+                if post.preview:
+                    print(f"   📄 Description: {post.preview}", file=buf)
 
                 # Show hashtags
                 if post.raw.hashtags:
-                    print(f"   🏷️  Hashtags: {', '.join(post.raw.hashtags[:5])}")
+                    print(f"   🏷️  Hashtags: {', '.join(post.raw.hashtags[:5])}", file=buf)
 
                 # Show comments if included
                 if post.raw.comments:
-                    print(f"   💬 {len(post.raw.comments)} comments")
+                    print(f"   💬 {len(post.raw.comments)} comments", file=buf)
                     # Show first comment
                     if post.raw.comments:
                         comment = post.raw.comments[0]
                         comment_preview = comment.text[:100]
-                        print(f"      └─ @{comment.username}: {comment_preview}...")
+                        print(f"      └─ @{comment.username}: {comment_preview}...", file=buf)
+
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when installed (pip install "postcrawl[fast]")
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -7,6 +7,7 @@ for searching and extracting content from social media platforms.
 
 __version__ = "0.1.1"
 
+from .cache import Cache, InMemoryLRUCache, RedisCache
 from .client import PostCrawlClient
 from .exceptions import (
     APIError,
@@ -39,6 +40,10 @@ from .types import (
 __all__ = [
     # Client
     "PostCrawlClient",
+    # Caching
+    "Cache",
+    "InMemoryLRUCache",
+    "RedisCache",
     # Types
     "ExtractedPost",
     "ExtractRequest",
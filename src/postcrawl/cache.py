@@ -0,0 +1,141 @@
+"""
+PostCrawl response caching.
+
+Caches store raw response bodies keyed by a hash of the request, so repeated
+identical search calls can be served without a network round-trip.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Protocol, runtime_checkable
+
+from .constants import DEFAULT_CACHE_MAXSIZE
+
+
+@runtime_checkable
+class Cache(Protocol):
+    """Interface for response caches used by PostCrawlClient."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for key, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store value under key, expiring after ttl seconds (None = never)."""
+        ...
+
+
+class InMemoryLRUCache:
+    """
+    In-process least-recently-used cache.
+
+    Safe to share between event loops in different threads (e.g. a client's async
+    calls and its *_sync methods).
+
+    Args:
+        maxsize: Maximum number of entries kept before the oldest is evicted
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store value under key, expiring after ttl seconds (None = never)."""
+        if ttl is not None and ttl <= 0:
+            return  # Already expired
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache:
+    """
+    Cache backed by Redis, shared across processes.
+
+    Args:
+        redis: A `redis.asyncio.Redis` client (requires the optional "redis" package)
+        prefix: Prefix added to every key stored in Redis
+    """
+
+    def __init__(self, redis: Any, *, prefix: str = "postcrawl:"):
+        self.redis = redis
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for key, or None if missing or expired."""
+        value = await self.redis.get(self.prefix + key)
+        if value is None:
+            return None
+        return value.encode() if isinstance(value, str) else bytes(value)
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        """Store value under key, expiring after ttl seconds (None = never)."""
+        if ttl is not None and ttl <= 0:
+            return  # Already expired; Redis rejects an expiry that isn't positive
+
+        await self.redis.set(
+            self.prefix + key,
+            value,
+            px=max(1, int(ttl * 1000)) if ttl is not None else None,
+        )
+
+
+def make_cache_key(api_key: str, base_url: str, endpoint: str, payload: dict[str, Any]) -> str:
+    """
+    Build a cache key for a request.
+
+    The API key is part of the key, so a cache shared between clients never serves one
+    account's responses to another (which would skip authentication and billing).
+
+    Platform order does not change results, so `social_platforms` is sorted to let
+    ["reddit", "tiktok"] and ["tiktok", "reddit"] share an entry.
+    """
+    if "social_platforms" in payload:
+        payload = {**payload, "social_platforms": sorted(payload["social_platforms"])}
+
+    key_hash = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+    raw = json.dumps([key_hash, base_url, endpoint, payload], sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+__all__ = [
+    "Cache",
+    "InMemoryLRUCache",
+    "RedisCache",
+    "make_cache_key",
+]
@@ -3,18 +3,35 @@ PostCrawl API client.
 """
 
 import asyncio
-from typing import Any
+import concurrent.futures
+import importlib.util
+import os
+import random
+import threading
+from collections.abc import AsyncIterator, Coroutine
+from typing import Any, TypeVar
 
 import httpx
+from pydantic import BaseModel, TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
+from .cache import Cache, make_cache_key
 from .constants import (
+    API_URL_ENV,
     API_VERSION,
     DEFAULT_BASE_URL,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_RETRY_DELAY,
     DEFAULT_RETRY_DELAY,
     DEFAULT_TIMEOUT,
     EXTRACT_ENDPOINT,
+    MAX_CONNECTIONS_ENV,
+    MAX_KEEPALIVE_CONNECTIONS_ENV,
     RATE_LIMIT_HEADER,
     RATE_LIMIT_REMAINING_HEADER,
     RATE_LIMIT_RESET_HEADER,
@@ -32,6 +49,12 @@ from .exceptions import (
     ValidationError,
 )
 from .types import (
+    _ERROR_RESPONSE_ADAPTER,
+    _EXTRACT_REQUEST_ADAPTER,
+    _EXTRACT_RESPONSE_ADAPTER,
+    _SEARCH_AND_EXTRACT_REQUEST_ADAPTER,
+    _SEARCH_REQUEST_ADAPTER,
+    _SEARCH_RESPONSE_ADAPTER,
     CommentFilterConfig,
     ErrorDetail,
     ErrorResponse,
@@ -39,14 +62,72 @@ from .types import (
     ExtractRequest,
     ExtractResponse,
     ResponseMode,
-    SearchAndExtractRequest,
     SearchAndExtractResponse,
-    SearchRequest,
     SearchResponse,
-    SearchResult,
     SocialPlatform,
 )
 
+# HTTP/2 needs the optional "h2" package (pip install postcrawl[http2]);
+# without it the client falls back to HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Incremental JSON parsing for iter_extract needs the optional "ijson" package
+# (pip install postcrawl[stream]); without it the response body is buffered.
+_IJSON_AVAILABLE = importlib.util.find_spec("ijson") is not None
+
+_T = TypeVar("_T")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def _validate_request(adapter: TypeAdapter[_T], params: dict[str, Any]) -> _T:
+    """Validate request parameters, raising ValidationError with per-field details."""
+    try:
+        return adapter.validate_python(params)
+    except PydanticValidationError as e:
+        raise ValidationError(
+            "Invalid request parameters",
+            details=[
+                ErrorDetail(
+                    field=".".join(str(loc) for loc in err["loc"]),
+                    code="invalid_value",
+                    message=err["msg"],
+                )
+                for err in e.errors()
+            ],
+        ) from None
+
+
+def _invalid_body_error(response: httpx.Response, reason: str) -> APIError:
+    """Error for a successful response whose body is not a valid list of posts."""
+    return APIError(
+        f"Invalid response body: {reason}",
+        status_code=response.status_code,
+        response=response,
+    )
+
+
+def _backoff_delay(base: float, previous: float) -> float:
+    """
+    Next retry delay using exponential backoff with decorrelated jitter.
+
+    The first retry waits `base`; later ones wait a random time between `base` and
+    three times the previous delay, capped at DEFAULT_MAX_RETRY_DELAY. A `base` of 0
+    disables waiting entirely.
+    """
+    if base <= 0:
+        return 0.0
+    return min(DEFAULT_MAX_RETRY_DELAY, random.uniform(base, max(base, previous * 3)))
+
 
 class PostCrawlClient:
     """
@@ -54,27 +135,39 @@ class PostCrawlClient:
 
     Args:
         api_key: Your PostCrawl API key (starts with 'sk_')
+        base_url: API base URL (defaults to $POSTCRAWL_API_URL or the production API)
         timeout: Request timeout in seconds (None = no timeout)
+        connect_timeout: Timeout for establishing a connection (None = same as timeout)
         max_retries: Maximum number of retry attempts
-        retry_delay: Delay between retries in seconds
+        retry_delay: Base delay between retries in seconds; later retries back off
+            exponentially with jitter (0 = retry immediately)
+        max_connections: Maximum number of concurrent connections in the pool
+            (defaults to $POSTCRAWL_MAX_CONNECTIONS or 100)
+        max_keepalive_connections: Maximum number of idle connections kept open
+            for reuse (defaults to $POSTCRAWL_MAX_KEEPALIVE or 100)
+        http2: Use HTTP/2 so concurrent requests share one connection. Requires the
+            optional "h2" package; falls back to HTTP/1.1 when it is not installed.
+        cache: Optional cache (e.g. InMemoryLRUCache or RedisCache) used to serve
+            repeated search() and search_and_extract() calls without a request;
+            entries are keyed per API key, so a cache can be shared safely
+        cache_ttl: Seconds a cached response stays valid (must be positive; None = until evicted)
 
     Example:
         ```python
-        client = PostCrawlClient(api_key="sk_...")
-
-        # Search for content
-        results = await client.search(
-            social_platforms=["reddit"],
-            query="machine learning",
-            results=10,
-            page=1
-        )
+        async with PostCrawlClient(api_key="sk_...") as client:
+            # Search for content
+            results = await client.search(
+                social_platforms=["reddit"],
+                query="machine learning",
+                results=10,
+                page=1
+            )
 
-        # Extract content from URLs
-        posts = await client.extract(
-            urls=["https://reddit.com/..."],
-            include_comments=True
-        )
+            # Extract content from URLs (reuses the same connection)
+            posts = await client.extract(
+                urls=["https://reddit.com/..."],
+                include_comments=True
+            )
         ```
     """
 
@@ -82,9 +175,16 @@ class PostCrawlClient:
         self,
         api_key: str,
         *,
+        base_url: str | None = None,
         timeout: float | None = DEFAULT_TIMEOUT,
+        connect_timeout: float | None = DEFAULT_CONNECT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        http2: bool = True,
+        cache: Cache | None = None,
+        cache_ttl: float | None = DEFAULT_CACHE_TTL,
     ):
         if not api_key:
             raise ValueError("API key is required")
@@ -92,15 +192,40 @@ class PostCrawlClient:
         if not api_key.startswith("sk_"):
             raise ValueError("API key must start with 'sk_'")
 
+        if cache_ttl is not None and cache_ttl <= 0:
+            raise ValueError("cache_ttl must be positive (or None for no expiry)")
+
         self.api_key = api_key
-        self.base_url = DEFAULT_BASE_URL.rstrip("/")
+        self.base_url = (base_url or os.getenv(API_URL_ENV) or DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_connections = (
+            max_connections
+            if max_connections is not None
+            else _env_int(MAX_CONNECTIONS_ENV, DEFAULT_MAX_CONNECTIONS)
+        )
+        self.max_keepalive_connections = (
+            max_keepalive_connections
+            if max_keepalive_connections is not None
+            else _env_int(MAX_KEEPALIVE_CONNECTIONS_ENV, DEFAULT_MAX_KEEPALIVE_CONNECTIONS)
+        )
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.cache = cache
+        self.cache_ttl = cache_ttl
 
         # Will be created when needed
         self._client: httpx.AsyncClient | None = None
 
+        # Background event loop used by the *_sync methods, started on first use. It
+        # gets its own HTTP client: an httpx.AsyncClient is bound to the loop it is
+        # first used on, so the two can't share one.
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_client: httpx.AsyncClient | None = None
+        self._sync_thread: threading.Thread | None = None
+        self._sync_lock = threading.Lock()
+
         # Track rate limit info
         self.rate_limit_info: dict[str, int | None] = {
             "limit": None,
@@ -109,32 +234,85 @@ class PostCrawlClient:
         }
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """
+        Get or create the HTTP client.
+
+        The client is created once and reused for every request until close() is
+        called, so keep-alive connections are shared across calls. Calls made through
+        the *_sync methods use a separate client that lives on the background loop.
+        """
+        if self._on_sync_loop():
+            if self._sync_client is None:
+                self._sync_client = self._create_client()
+            return self._sync_client
+
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "User-Agent": USER_AGENT,
-                    "Content-Type": "application/json",
-                },
-            )
+            self._client = self._create_client()
         return self._client
 
+    def _on_sync_loop(self) -> bool:
+        """Whether the caller is running on the background loop of the *_sync methods."""
+        return self._sync_thread is not None and threading.current_thread() is self._sync_thread
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create an HTTP client with the configured pool, timeouts and headers."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=self.http2,
+            timeout=httpx.Timeout(
+                self.timeout,
+                connect=(
+                    self.connect_timeout if self.connect_timeout is not None else self.timeout
+                ),
+            ),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "User-Agent": USER_AGENT,
+                "Content-Type": "application/json",
+            },
+        )
+
     async def __aenter__(self) -> "PostCrawlClient":
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
+        """Async context manager exit; also shuts down the *_sync background loop."""
         await self.close()
+        if self._sync_loop is not None:
+            await asyncio.to_thread(self.close_sync)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """
+        Close the HTTP client used on the current event loop.
+
+        The *_sync methods use their own client on a background loop; close it with
+        close_sync() (leaving an `async with` block closes both).
+        """
+        if self._on_sync_loop():
+            client, self._sync_client = self._sync_client, None
+        else:
+            client, self._client = self._client, None
+        if client:
+            await client.aclose()
+
+    def __del__(self) -> None:
+        # Best effort for clients whose close_sync() was never called: shut the
+        # background loop down, without blocking garbage collection for long
+        if getattr(self, "_sync_loop", None) is None or self._on_sync_loop():
+            return
+        if self._sync_lock.acquire(blocking=False):
+            try:
+                self._shutdown_sync_loop(timeout=1.0)
+            except Exception:
+                pass
+            finally:
+                self._sync_lock.release()
 
     def _update_rate_limit_info(self, headers: httpx.Headers) -> None:
         """Update rate limit information from response headers."""
@@ -150,8 +328,9 @@ class PostCrawlClient:
         method: str,
         endpoint: str,
         *,
-        json: dict[str, Any] | None = None,
+        content: str | None = None,
         retry_count: int = 0,
+        previous_delay: float = 0.0,
     ) -> httpx.Response:
         """Make an HTTP request with retry logic."""
         client = self._get_client()
@@ -161,7 +340,7 @@ class PostCrawlClient:
             response = await client.request(
                 method=method,
                 url=url,
-                json=json,
+                content=content,
             )
 
             # Update rate limit info
@@ -177,17 +356,44 @@ class PostCrawlClient:
             raise TimeoutError(original_error=e) from None
         except httpx.NetworkError as e:
             if retry_count < self.max_retries:
-                await asyncio.sleep(self.retry_delay * (retry_count + 1))
+                delay = _backoff_delay(self.retry_delay, previous_delay)
+                if delay:
+                    await asyncio.sleep(delay)
                 return await self._make_request(
-                    method, endpoint, json=json, retry_count=retry_count + 1
+                    method,
+                    endpoint,
+                    content=content,
+                    retry_count=retry_count + 1,
+                    previous_delay=delay,
                 )
             raise NetworkError(f"Network error: {str(e)}", original_error=e) from None
 
+    async def _post_cached(self, endpoint: str, request: BaseModel) -> bytes:
+        """POST a request and return the response body, using the cache if configured."""
+        content = request.model_dump_json(exclude_none=True)
+        if self.cache is None:
+            response = await self._make_request("POST", endpoint, content=content)
+            return response.content
+
+        key = make_cache_key(
+            self.api_key,
+            self.base_url,
+            endpoint,
+            request.model_dump(mode="json", exclude_none=True),
+        )
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self._make_request("POST", endpoint, content=content)
+        await self.cache.set(key, response.content, self.cache_ttl)
+        return response.content
+
     async def _handle_error_response(self, response: httpx.Response) -> None:
         """Handle error responses from the API."""
         try:
-            error_data = response.json()
-            error_response = ErrorResponse(**error_data)
+            # Decode and validate in one pass with pydantic-core's JSON parser
+            error_response = _ERROR_RESPONSE_ADAPTER.validate_json(response.content)
         except Exception:
             # If we can't parse the error, use the raw response
             error_response = ErrorResponse(
@@ -260,36 +466,24 @@ class PostCrawlClient:
             APIError: For other API errors
         """
         # Validate request
-        try:
-            request = SearchRequest(
-                social_platforms=social_platforms,
-                query=query,
-                results=results,
-                page=page,
-            )
-        except PydanticValidationError as e:
-            raise ValidationError(
-                "Invalid request parameters",
-                details=[
-                    ErrorDetail(
-                        field=".".join(str(loc) for loc in err["loc"]),
-                        code="invalid_value",
-                        message=err["msg"],
-                    )
-                    for err in e.errors()
-                ],
-            ) from None
+        request = _validate_request(
+            _SEARCH_REQUEST_ADAPTER,
+            {
+                "social_platforms": social_platforms,
+                "query": query,
+                "results": results,
+                "page": page,
+            },
+        )
 
-        # Make request
-        response = await self._make_request(
-            "POST",
+        # Make request (served from the cache when one is configured)
+        content = await self._post_cached(
             SEARCH_ENDPOINT,
-            json=request.model_dump(mode="json", exclude_none=True),
+            request,
         )
 
-        # Parse response
-        data = response.json()
-        return [SearchResult(**post) for post in data]
+        # Parse response - decode and validate the raw body in one pass
+        return _SEARCH_RESPONSE_ADAPTER.validate_json(content)
 
     async def extract(
         self,
@@ -303,7 +497,7 @@ class PostCrawlClient:
         Extract content from social media URLs.
 
         Args:
-            urls: List of URLs to extract (max 25)
+            urls: List of URLs to extract (max 100)
             include_comments: Whether to include comments (default: False)
             response_mode: Response format ("raw" or "markdown", default: "raw")
             comment_filter_config: Optional configuration for comment filtering
@@ -319,36 +513,214 @@ class PostCrawlClient:
             APIError: For other API errors
         """
         # Validate request
-        try:
-            request = ExtractRequest(
-                urls=urls,
-                include_comments=include_comments,
-                response_mode=response_mode,
-                comment_filter_config=comment_filter_config,
-            )
-        except PydanticValidationError as e:
-            raise ValidationError(
-                "Invalid request parameters",
-                details=[
-                    ErrorDetail(
-                        field=".".join(str(loc) for loc in err["loc"]),
-                        code="invalid_value",
-                        message=err["msg"],
-                    )
-                    for err in e.errors()
-                ],
-            ) from None
+        request = _validate_request(
+            _EXTRACT_REQUEST_ADAPTER,
+            {
+                "urls": urls,
+                "include_comments": include_comments,
+                "response_mode": response_mode,
+                "comment_filter_config": comment_filter_config,
+            },
+        )
 
+        return await self._post_extract(request)
+
+    async def _post_extract(self, request: ExtractRequest) -> ExtractResponse:
+        """Send a validated extract request and parse the response."""
         # Make request
         response = await self._make_request(
             "POST",
             EXTRACT_ENDPOINT,
-            json=request.model_dump(mode="json", exclude_none=True),
+            content=request.model_dump_json(exclude_none=True),
+        )
+
+        # Parse response - decode and validate the raw body in one pass
+        return _EXTRACT_RESPONSE_ADAPTER.validate_json(response.content)
+
+    async def iter_extract(
+        self,
+        *,
+        urls: list[str],
+        include_comments: bool = False,
+        response_mode: ResponseMode = "raw",
+        comment_filter_config: CommentFilterConfig | None = None,
+    ) -> AsyncIterator[ExtractedPost]:
+        """
+        Extract content from URLs, yielding each post as soon as it has been received.
+
+        Unlike extract(), the response body is parsed incrementally as it streams in,
+        so large responses (e.g. raw posts with comment trees) are never held in
+        memory in full. Incremental parsing requires the optional "ijson" package;
+        without it the body is buffered and parsed once complete. Streamed requests
+        are not retried on network errors.
+
+        Args:
+            urls: List of URLs to extract (max 100)
+            include_comments: Whether to include comments (default: False)
+            response_mode: Response format ("raw" or "markdown", default: "raw")
+            comment_filter_config: Optional configuration for comment filtering
+
+        Yields:
+            Extracted posts with content, in response order
+
+        Raises:
+            ValidationError: If request parameters are invalid
+            AuthenticationError: If API key is invalid
+            InsufficientCreditsError: If account has insufficient credits
+            RateLimitError: If rate limit is exceeded
+            APIError: For other API errors, or if the response body is not a valid
+                list of posts (e.g. not a JSON array, or truncated)
+        """
+        # Validate request
+        request = _validate_request(
+            _EXTRACT_REQUEST_ADAPTER,
+            {
+                "urls": urls,
+                "include_comments": include_comments,
+                "response_mode": response_mode,
+                "comment_filter_config": comment_filter_config,
+            },
         )
 
-        # Parse response - Pydantic will handle type validation automatically
-        data = response.json()
-        return [ExtractedPost(**post_data) for post_data in data]
+        client = self._get_client()
+        try:
+            async with client.stream(
+                "POST",
+                f"/{API_VERSION}{EXTRACT_ENDPOINT}",
+                content=request.model_dump_json(exclude_none=True),
+            ) as response:
+                # Update rate limit info
+                self._update_rate_limit_info(response.headers)
+
+                # Check for errors
+                if response.status_code >= 400:
+                    await response.aread()
+                    await self._handle_error_response(response)
+
+                if not _IJSON_AVAILABLE:
+                    try:
+                        posts = _EXTRACT_RESPONSE_ADAPTER.validate_json(await response.aread())
+                    except PydanticValidationError as e:
+                        raise _invalid_body_error(response, str(e)) from None
+                    for post in posts:
+                        yield post
+                    return
+
+                import ijson  # type: ignore[import-untyped]
+
+                # Feed chunks to a push parser; the items completed by each chunk are
+                # validated together in one call to the shared list adapter
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, "item", use_float=True)
+                started = False
+                try:
+                    async for chunk in response.aiter_bytes():
+                        if not started:
+                            # The parser finds no items in a body that isn't an array
+                            # instead of failing, so check the first byte of the body
+                            chunk = chunk.lstrip()
+                            if not chunk:
+                                continue
+                            if not chunk.startswith(b"["):
+                                raise _invalid_body_error(response, "expected a JSON array")
+                            started = True
+                        parser.send(chunk)
+                        if items:
+                            posts = _EXTRACT_RESPONSE_ADAPTER.validate_python(items)
+                            items.clear()
+                            for post in posts:
+                                yield post
+                    if not started:
+                        raise _invalid_body_error(response, "expected a JSON array")
+                    parser.close()
+                    posts = _EXTRACT_RESPONSE_ADAPTER.validate_python(items)
+                except (ijson.JSONError, PydanticValidationError) as e:
+                    raise _invalid_body_error(response, str(e)) from None
+                for post in posts:
+                    yield post
+
+        except httpx.TimeoutException as e:
+            raise TimeoutError(original_error=e) from None
+        except httpx.NetworkError as e:
+            raise NetworkError(f"Network error: {str(e)}", original_error=e) from None
+
+    async def extract_stream(
+        self,
+        *,
+        urls: list[str],
+        batch_size: int = 10,
+        max_concurrency: int = 4,
+        include_comments: bool = False,
+        response_mode: ResponseMode = "raw",
+        comment_filter_config: CommentFilterConfig | None = None,
+    ) -> AsyncIterator[ExtractedPost]:
+        """
+        Extract content from URLs in concurrent batches, yielding posts as batches finish.
+
+        Duplicate URLs are dropped, then the URLs are split into batches of `batch_size`
+        and submitted as separate extract requests, with at most `max_concurrency`
+        requests in flight. Every batch is validated before the first request is sent.
+        Posts from a batch are yielded as soon as it completes, so results arrive in
+        completion order rather than input order.
+
+        Args:
+            urls: List of URLs to extract
+            batch_size: Number of URLs per extract request (default: 10)
+            max_concurrency: Maximum number of concurrent extract requests (default: 4)
+            include_comments: Whether to include comments (default: False)
+            response_mode: Response format ("raw" or "markdown", default: "raw")
+            comment_filter_config: Optional configuration for comment filtering
+
+        Yields:
+            Extracted posts with content
+
+        Raises:
+            ValueError: If batch_size or max_concurrency is less than 1
+            ValidationError: If request parameters are invalid
+            AuthenticationError: If API key is invalid
+            InsufficientCreditsError: If account has insufficient credits
+            RateLimitError: If rate limit is exceeded
+            APIError: For other API errors
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        # Deduplicate across the whole list so a URL is never extracted by two batches,
+        # and validate every batch up front so a bad URL fails before anything is sent.
+        # An empty list still yields one (empty) batch, which fails validation like
+        # extract(urls=[]) does.
+        urls = list(dict.fromkeys(urls))
+        requests = [
+            _validate_request(
+                _EXTRACT_REQUEST_ADAPTER,
+                {
+                    "urls": urls[i : i + batch_size],
+                    "include_comments": include_comments,
+                    "response_mode": response_mode,
+                    "comment_filter_config": comment_filter_config,
+                },
+            )
+            for i in range(0, max(len(urls), 1), batch_size)
+        ]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_batch(request: ExtractRequest) -> ExtractResponse:
+            async with semaphore:
+                return await self._post_extract(request)
+
+        tasks = [asyncio.create_task(extract_batch(request)) for request in requests]
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for post in await next_batch:
+                    yield post
+        finally:
+            # Stop outstanding batches if the caller stops iterating or a batch fails
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def search_and_extract(
         self,
@@ -384,49 +756,115 @@ class PostCrawlClient:
             APIError: For other API errors
         """
         # Validate request
-        try:
-            request = SearchAndExtractRequest(
-                social_platforms=social_platforms,
-                query=query,
-                results=results,
-                page=page,
-                include_comments=include_comments,
-                response_mode=response_mode,
-                comment_filter_config=comment_filter_config,
-            )
-        except PydanticValidationError as e:
-            raise ValidationError(
-                "Invalid request parameters",
-                details=[
-                    ErrorDetail(
-                        field=".".join(str(loc) for loc in err["loc"]),
-                        code="invalid_value",
-                        message=err["msg"],
-                    )
-                    for err in e.errors()
-                ],
-            ) from None
+        request = _validate_request(
+            _SEARCH_AND_EXTRACT_REQUEST_ADAPTER,
+            {
+                "social_platforms": social_platforms,
+                "query": query,
+                "results": results,
+                "page": page,
+                "include_comments": include_comments,
+                "response_mode": response_mode,
+                "comment_filter_config": comment_filter_config,
+            },
+        )
 
-        # Make request
-        response = await self._make_request(
-            "POST",
+        # Make request (served from the cache when one is configured)
+        content = await self._post_cached(
             SEARCH_AND_EXTRACT_ENDPOINT,
-            json=request.model_dump(mode="json", exclude_none=True),
+            request,
         )
 
-        # Parse response - Pydantic will handle type validation automatically
-        data = response.json()
-        return [ExtractedPost(**post_data) for post_data in data]
+        # Parse response - decode and validate the raw body in one pass
+        return _EXTRACT_RESPONSE_ADAPTER.validate_json(content)
 
     # Synchronous convenience methods
+    def _run_sync(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """
+        Run a coroutine on the client's background event loop and wait for the result.
+
+        The loop runs in a daemon thread until close_sync() is called, so sync calls
+        share one event loop (and one connection pool) instead of creating a new loop
+        per call.
+        """
+        if self._on_sync_loop():
+            coro.close()
+            raise RuntimeError(
+                "*_sync methods can't be called from the client's background event loop; "
+                "await the async method instead"
+            )
+
+        with self._sync_lock:
+            if self._sync_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="postcrawl-sync", daemon=True
+                )
+                thread.start()
+                self._sync_loop, self._sync_thread = loop, thread
+            # Submit while holding the lock so close_sync() can't stop the loop first
+            future = asyncio.run_coroutine_threadsafe(coro, self._sync_loop)
+
+        try:
+            return future.result(self._sync_result_timeout())
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError("Timed out waiting for the background event loop") from None
+
+    def _sync_result_timeout(self) -> float | None:
+        """
+        Longest time a *_sync call waits for its result (None = no timeout).
+
+        Allows the full timeout plus the longest backoff for the first attempt and
+        every retry, so it only trips when the background loop itself is stuck.
+        """
+        if self.timeout is None:
+            return None
+        return (self.timeout + DEFAULT_MAX_RETRY_DELAY) * (self.max_retries + 1) + 5
+
+    def close_sync(self) -> None:
+        """
+        Close the HTTP client used by the *_sync methods and stop their event loop.
+
+        Sync calls still running on the loop are cancelled. A later sync call starts
+        a new loop.
+        """
+        if self._on_sync_loop():
+            raise RuntimeError("close_sync() can't be called from the client's background loop")
+
+        with self._sync_lock:
+            self._shutdown_sync_loop(self._sync_result_timeout())
+
+    def _shutdown_sync_loop(self, timeout: float | None) -> None:
+        """Cancel pending work, close the sync HTTP client and close the background loop."""
+        loop, thread = self._sync_loop, self._sync_thread
+        if loop is None or thread is None:
+            return
+
+        async def shutdown() -> None:
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+            self._sync_loop = self._sync_thread = None
+
     def search_sync(self, **kwargs: Any) -> SearchResponse:
         """Synchronous version of search()."""
-        return asyncio.run(self.search(**kwargs))
+        return self._run_sync(self.search(**kwargs))
 
     def extract_sync(self, **kwargs: Any) -> ExtractResponse:
         """Synchronous version of extract()."""
-        return asyncio.run(self.extract(**kwargs))
+        return self._run_sync(self.extract(**kwargs))
 
     def search_and_extract_sync(self, **kwargs: Any) -> SearchAndExtractResponse:
         """Synchronous version of search_and_extract()."""
-        return asyncio.run(self.search_and_extract(**kwargs))
+        return self._run_sync(self.search_and_extract(**kwargs))
@@ -14,8 +14,26 @@ SEARCH_AND_EXTRACT_ENDPOINT = "/search-and-extract"
 
 # Request defaults
 DEFAULT_TIMEOUT = None  # No timeout
+DEFAULT_CONNECT_TIMEOUT = None  # Falls back to DEFAULT_TIMEOUT
 DEFAULT_MAX_RETRIES = 3
-DEFAULT_RETRY_DELAY = 1.0  # seconds
+DEFAULT_RETRY_DELAY = 1.0  # seconds, base of the exponential backoff
+DEFAULT_MAX_RETRY_DELAY = 30.0  # seconds, cap on a single backoff
+
+# Connection pool defaults (shared across all requests made by a client)
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100  # Keep every pooled connection warm between bursts
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds an idle connection is kept open
+
+# Response cache defaults
+DEFAULT_CACHE_TTL = 300.0  # seconds
+DEFAULT_CACHE_MAXSIZE = 1024
+
+# Environment variable overriding DEFAULT_BASE_URL (read when a client is created)
+API_URL_ENV = "POSTCRAWL_API_URL"
+
+# Environment variables overriding the connection pool defaults
+MAX_CONNECTIONS_ENV = "POSTCRAWL_MAX_CONNECTIONS"
+MAX_KEEPALIVE_CONNECTIONS_ENV = "POSTCRAWL_MAX_KEEPALIVE"
 
 # Headers
 USER_AGENT = "postcrawl-python/0.1.0"
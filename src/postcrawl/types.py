@@ -10,9 +10,21 @@ Key Types:
 - SocialPost: DEPRECATED - Legacy search response type (use SearchResult instead)
 """
 
-from typing import Any, Literal
-
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+import re
+from typing import Annotated, Any, ClassVar, Literal
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    StringConstraints,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+from pydantic import ValidationError as PydanticValidationError
 
 # Import all generated types
 from .generated_types import (
@@ -33,10 +45,23 @@ from .generated_types import (
     SearchRequest as GeneratedSearchRequest,
 )
 
+# Fast path for the common case: a dotted DNS host, optional numeric port, then a
+# path/query/fragment. Anything else (IP literals, single-label hosts, odd ports) is
+# left to Pydantic's full HttpUrl parser; the API performs full validation server-side.
+_URL_RE = re.compile(
+    r"^https?://(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z]{2,63}(?::\d{1,5})?(?:[/?#]\S*)?$",
+    re.IGNORECASE,
+)
+_HTTP_URL_ADAPTER: TypeAdapter[HttpUrl] = TypeAdapter(HttpUrl)
+
 # Re-export enums with proper names
 SocialPlatform = Literal["reddit", "tiktok"]
 ResponseMode = Literal["raw", "markdown"]
 
+# Request field constraints, enforced by pydantic-core without Python callbacks
+_SearchQuery = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+_SocialPlatforms = Annotated[list[SocialPlatform], Field(min_length=1)]
+
 
 class CommentFilterConfig(BaseModel):
     """Configuration for server-side comment filtering."""
@@ -72,28 +97,41 @@ class CommentFilterConfig(BaseModel):
 
 # Custom ExtractRequest with URL validation and field descriptions
 class ExtractRequest(GeneratedExtractRequest):
-    """Request model for the extract endpoint with additional validation."""
+    """
+    Request model for the extract endpoint with additional validation.
+
+    Duplicate URLs are dropped (keeping the first occurrence) so the API doesn't
+    extract - and bill for - the same post twice.
+    """
 
+    # Set to True to run Pydantic's full HttpUrl parser on every URL, not only on
+    # those the fast-path regex doesn't match
+    strict_urls: ClassVar[bool] = False
+
+    urls: Annotated[list[str], Field(min_length=1, max_length=100)]
     comment_filter_config: CommentFilterConfig | None = Field(
         None, description="Optional configuration for comment filtering."
     )
 
+    @field_validator("urls", mode="before")
+    @classmethod
+    def _drop_duplicate_urls(cls, v: Any) -> Any:
+        """Drop duplicate URLs before the length limit is checked."""
+        if isinstance(v, list) and all(isinstance(url, str) for url in v):
+            # dict preserves insertion order, so this keeps the first occurrence of each URL
+            return list(dict.fromkeys(v))
+        return v  # Leave anything else for the list[str] validation to report
+
     @field_validator("urls")
     @classmethod
     def validate_urls(cls, v: list[str]) -> list[str]:
-        """Validate URLs list and each URL format."""
-        if len(v) == 0:
-            raise ValueError("At least one URL is required")
-        if len(v) > 100:
-            raise ValueError("Cannot process more than 100 URLs at once")
-
-        # Validate each URL
+        """Validate each URL format (duplicates and length are handled by then)."""
         for url in v:
-            try:
-                # Use Pydantic's HttpUrl for validation
-                HttpUrl(url)
-            except Exception:
-                raise ValueError(f"Invalid URL format: {url}") from None
+            if cls.strict_urls or not _URL_RE.match(url):
+                try:
+                    _HTTP_URL_ADAPTER.validate_python(url)
+                except PydanticValidationError:
+                    raise ValueError(f"Invalid URL format: {url}") from None
 
         return v
 
@@ -102,42 +140,30 @@ class ExtractRequest(GeneratedExtractRequest):
 class SearchRequest(GeneratedSearchRequest):
     """Request model for the search endpoint with additional validation."""
 
-    @field_validator("query")
-    @classmethod
-    def validate_query(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError("Query cannot be empty")
-        return v
-
-    @field_validator("social_platforms")
-    @classmethod
-    def validate_social_platforms(cls, v: list[SocialPlatform]) -> list[SocialPlatform]:
-        if not v or len(v) == 0:
-            raise ValueError("At least one social platform is required")
-        return v
+    query: _SearchQuery
+    social_platforms: _SocialPlatforms
 
 
 # Custom SearchAndExtractRequest with validations
 class SearchAndExtractRequest(GeneratedSearchAndExtractRequest):
     """Request model for the search-and-extract endpoint with additional validation."""
 
+    query: _SearchQuery
+    social_platforms: _SocialPlatforms
     comment_filter_config: CommentFilterConfig | None = Field(
         None, description="Optional configuration for comment filtering."
     )
 
-    @field_validator("query")
-    @classmethod
-    def validate_query(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError("Query cannot be empty")
-        return v
 
-    @field_validator("social_platforms")
-    @classmethod
-    def validate_social_platforms(cls, v: list[SocialPlatform]) -> list[SocialPlatform]:
-        if not v or len(v) == 0:
-            raise ValueError("At least one social platform is required")
-        return v
+# Platform model for each `source` value, used to validate `raw` directly
+_RAW_MODELS: dict[str, type[RedditPost] | type[TiktokPost]] = {
+    "reddit": RedditPost,
+    "tiktok": TiktokPost,
+}
+
+
+# Number of description characters shown by ExtractedPost.preview
+_PREVIEW_LENGTH = 150
 
 
 # Response Models - Extend the generated PostOutputT type
@@ -150,23 +176,42 @@ class ExtractedPost(PostOutputT):
     # - raw: RedditPost | TiktokPost | None
     # - markdown: str | None
     # - error: str | None
-
-    # Additional fields for backward compatibility
-    title: str | None = Field(None, description="Post title")
-    author: str | None = Field(None, description="Post author")
-    content: str | None = Field(None, description="Post content")
-    comments: list[Any] | None = Field(None, description="Post comments")
+    #
+    # Post details (title, author, content, comments) live on `raw`.
 
     model_config = ConfigDict(
-        extra="allow",  # Allow extra fields from API
+        extra="ignore",  # Skip unknown fields from the API instead of storing them
         populate_by_name=True,  # For backward compatibility
+        frozen=True,
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _validate_raw_for_source(cls, data: Any) -> Any:
+        """Validate `raw` with the model matching `source` instead of trying each one."""
+        if isinstance(data, dict) and isinstance(data.get("raw"), dict):
+            model = _RAW_MODELS.get(data.get("source"))  # type: ignore[arg-type]
+            if model is not None:
+                try:
+                    return {**data, "raw": model.model_validate(data["raw"])}
+                except PydanticValidationError:
+                    pass  # Fall back to the union so it can report the errors
+        return data
+
     @property
     def platform(self) -> str:
         """Alias for source for backward compatibility."""
         return self.source
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def preview(self) -> str:
+        """Post description truncated for display."""
+        description = getattr(self.raw, "description", None) or ""
+        if len(description) > _PREVIEW_LENGTH:
+            return description[:_PREVIEW_LENGTH] + "..."
+        return description
+
     def is_reddit_post(self) -> bool:
         """Check if this is a Reddit post."""
         return self.source == "reddit" and isinstance(self.raw, RedditPost)
@@ -205,6 +250,8 @@ class SocialPost(BaseModel):
     but does not match the actual API response.
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str | None = Field(None, description="Unique identifier for the post")
     title: str | None = Field(None, description="Post title")
     author: str | None = Field(None, description="Post author username")
@@ -220,6 +267,18 @@ ExtractResponse = list[ExtractedPost]
 SearchResponse = list[SearchResult]  # Updated to use SearchResult
 SearchAndExtractResponse = list[ExtractedPost]
 
+# Validators for whole response lists, built once at import and shared by the client.
+# Validating the list in a single call keeps the per-item loop inside pydantic-core.
+_SEARCH_RESPONSE_ADAPTER: TypeAdapter[SearchResponse] = TypeAdapter(SearchResponse)
+_EXTRACT_RESPONSE_ADAPTER: TypeAdapter[ExtractResponse] = TypeAdapter(ExtractResponse)
+
+# Request validators, likewise built once and used by the client on every call
+_SEARCH_REQUEST_ADAPTER: TypeAdapter[SearchRequest] = TypeAdapter(SearchRequest)
+_EXTRACT_REQUEST_ADAPTER: TypeAdapter[ExtractRequest] = TypeAdapter(ExtractRequest)
+_SEARCH_AND_EXTRACT_REQUEST_ADAPTER: TypeAdapter[SearchAndExtractRequest] = TypeAdapter(
+    SearchAndExtractRequest
+)
+
 
 # Type guard functions for type narrowing
 def is_reddit_post(raw: Any) -> bool:
@@ -268,6 +327,8 @@ __all__ = [
 class ErrorDetail(BaseModel):
     """Error detail for field-specific errors."""
 
+    model_config = ConfigDict(frozen=True)
+
     field: str
     code: str
     message: str
@@ -276,7 +337,13 @@ class ErrorDetail(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response format."""
 
+    model_config = ConfigDict(frozen=True)
+
     error: str
     message: str
     request_id: str | None = None
     details: list[ErrorDetail] | None = None
+
+
+# Error body validator, built once and used by the client on every 4xx/5xx response
+_ERROR_RESPONSE_ADAPTER: TypeAdapter[ErrorResponse] = TypeAdapter(ErrorResponse)
@@ -1,26 +1,131 @@
 """
 Pytest configuration and fixtures for PostCrawl SDK tests.
+
+Mock data fixtures are session-scoped and shared by every test, so treat them as
+read-only: copy (e.g. `{**mock_reddit_post, ...}` or `copy.deepcopy`) before changing them.
 """
 
+import importlib.util
+
+import httpx
 import pytest
+import pytest_asyncio
 
+from postcrawl import PostCrawlClient
+from postcrawl.constants import API_URL_ENV, MAX_CONNECTIONS_ENV, MAX_KEEPALIVE_CONNECTIONS_ENV
 
-@pytest.fixture
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed, else on the default loop."""
+    if importlib.util.find_spec("uvloop") is None:
+        return None
+
+    import uvloop
+
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def clean_env():
+    """Clear the client's environment settings so a developer's shell can't change results.
+
+    Session-scoped so it is in place before the module-scoped shared client is built;
+    tests that need a variable set it with monkeypatch.setenv.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name in (API_URL_ENV, MAX_CONNECTIONS_ENV, MAX_KEEPALIVE_CONNECTIONS_ENV):
+            mp.delenv(name, raising=False)
+        yield
+
+
+@pytest.fixture(scope="session")
 def api_key():
     """Valid API key for testing."""
     return "sk_test_1234567890abcdef"
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shared_client(api_key):
+    """One opened client per test module, so its connection pool is set up once.
+
+    The context manager path (open, close) is covered by the lifecycle tests, which
+    construct their own clients.
+    """
+    async with PostCrawlClient(api_key=api_key, retry_delay=0) as client:
+        yield client
+
+
+@pytest.fixture
+def client(shared_client):
+    """The module's shared client, with rate limit info reset for each test.
+
+    Tests that need custom settings (timeouts, retries, caching) or that check the
+    client lifecycle should construct their own PostCrawlClient instead.
+    """
+    shared_client.rate_limit_info.update(limit=None, remaining=None, reset=None)
+    return shared_client
+
+
+@pytest.fixture
+def sync_client(api_key):
+    """A client for the *_sync wrappers, whose background event loop is closed afterwards.
+
+    The sync wrappers run on their own loop, so they can't use the shared client.
+    """
+    client = PostCrawlClient(api_key=api_key)
+    yield client
+    client.close_sync()
+
+
+# Parsed once, so pytest-httpx doesn't re-parse the URL string for every mock
+API_URLS = {
+    endpoint: httpx.URL(f"https://edge.postcrawl.com/v1{endpoint}")
+    for endpoint in ("/search", "/extract", "/search-and-extract")
+}
+
+
+@pytest.fixture
+def register_mock(httpx_mock):
+    """Return a helper that mocks a POST response from an API endpoint."""
+
+    def register(endpoint, payload, status=200, headers=None):
+        httpx_mock.add_response(
+            method="POST",
+            url=API_URLS[endpoint],
+            json=payload,
+            status_code=status,
+            headers=headers,
+        )
+
+    return register
+
+
+@pytest.fixture(autouse=True)
+def endpoint_mock(request):
+    """Register the response for tests marked `@pytest.mark.endpoint(...)`.
+
+    `@pytest.mark.endpoint("/search", "mock_search_response")` mocks the endpoint with
+    the named fixture's data; without a fixture name it returns an empty list.
+    """
+    marker = request.node.get_closest_marker("endpoint")
+    if marker is None:
+        return
+
+    endpoint, *payload_fixture = marker.args
+    payload = request.getfixturevalue(payload_fixture[0]) if payload_fixture else []
+    request.getfixturevalue("register_mock")(endpoint, payload)
+
+
 @pytest.fixture
 def invalid_api_key():
     """Invalid API key format."""
     return "invalid_key"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_search_response():
     """Mock search response data."""
-    return [
+    return (
         {
             "title": "Understanding Machine Learning Basics",
             "url": "https://www.reddit.com/r/MachineLearning/comments/abc123/understanding_ml_basics/",
@@ -41,10 +146,10 @@ def mock_search_response():
             "date": "Dec 27, 2024",
             "imageUrl": "",
         },
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_reddit_post():
     """Mock Reddit post data."""
     return {
@@ -74,7 +179,7 @@ def mock_reddit_post():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tiktok_post():
     """Mock TikTok post data."""
     return {
@@ -101,10 +206,10 @@ def mock_tiktok_post():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_extract_response():
     """Mock extract response with mixed results."""
-    return [
+    return (
         {
             "url": "https://www.reddit.com/r/Python/comments/1ab2c3d/test_post/",
             "source": "reddit",
@@ -148,10 +253,10 @@ def mock_extract_response():
             "markdown": None,
             "error": "Failed to extract content: Invalid URL",
         },
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_error_response():
     """Mock error response from API."""
     return {
@@ -164,7 +269,7 @@ def mock_error_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rate_limit_headers():
     """Mock rate limit headers."""
     return {
@@ -3,150 +3,184 @@ Tests for async/sync method functionality.
 """
 
 import asyncio
+import gc
+import json
 
 import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+from pytest_httpx import HTTPXMock, IteratorStream
 
 from postcrawl import PostCrawlClient
-from postcrawl.exceptions import TimeoutError
+from postcrawl.exceptions import APIError, InsufficientCreditsError, TimeoutError, ValidationError
+
+from .conftest import API_URLS
+
+SEARCH_KWARGS = {
+    "social_platforms": ["reddit", "tiktok"],
+    "query": "test",
+    "results": 10,
+    "page": 1,
+}
+EXTRACT_KWARGS = {
+    "urls": [
+        "https://www.reddit.com/r/test/comments/123/",
+        "https://www.tiktok.com/@user/video/456",
+    ]
+}
+
+# (method name, endpoint, payload fixture, call kwargs) for each happy-path API call
+ENDPOINT_CASES = [
+    pytest.param("search", "/search", "mock_search_response", SEARCH_KWARGS, id="search"),
+    pytest.param("extract", "/extract", "mock_extract_response", EXTRACT_KWARGS, id="extract"),
+    pytest.param(
+        "search_and_extract",
+        "/search-and-extract",
+        "mock_extract_response",
+        SEARCH_KWARGS,
+        id="search_and_extract",
+    ),
+]
 
 
 class TestAsyncMethods:
     """Test async method functionality."""
 
     @pytest.mark.asyncio
-    async def test_async_search(self, httpx_mock: HTTPXMock, api_key, mock_search_response):
-        """Test async search method."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=mock_search_response,
-            status_code=200,
-        )
+    @pytest.mark.parametrize("method_name,endpoint,payload_fixture,kwargs", ENDPOINT_CASES)
+    async def test_async_method(
+        self, request, register_mock, client, method_name, endpoint, payload_fixture, kwargs
+    ):
+        """Test each async API method returns the mocked results."""
+        payload = request.getfixturevalue(payload_fixture)
+        register_mock(endpoint, payload)
 
-        client = PostCrawlClient(api_key=api_key)
-        try:
-            results = await client.search(
-                social_platforms=["reddit"], query="test", results=10, page=1
-            )
-            assert len(results) == 2
-        finally:
-            await client.close()
+        results = await getattr(client, method_name)(**kwargs)
 
-    @pytest.mark.asyncio
-    async def test_async_extract(self, httpx_mock: HTTPXMock, api_key, mock_extract_response):
-        """Test async extract method."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/extract",
-            json=mock_extract_response,
-            status_code=200,
-        )
+        assert [result.url for result in results] == [item["url"] for item in payload]
 
-        client = PostCrawlClient(api_key=api_key)
-        try:
-            results = await client.extract(urls=["https://www.reddit.com/r/test/comments/123/"])
-            assert len(results) == 3
-        finally:
-            await client.close()
 
-    @pytest.mark.asyncio
-    async def test_async_search_and_extract(
-        self, httpx_mock: HTTPXMock, api_key, mock_extract_response
+class TestSyncMethods:
+    """Test sync wrapper methods."""
+
+    @pytest.mark.parametrize("method_name,endpoint,payload_fixture,kwargs", ENDPOINT_CASES)
+    def test_sync_method(
+        self, request, register_mock, sync_client, method_name, endpoint, payload_fixture, kwargs
     ):
-        """Test async search_and_extract method."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search-and-extract",
-            json=mock_extract_response[:2],
-            status_code=200,
-        )
+        """Test each sync wrapper returns the mocked results."""
+        payload = request.getfixturevalue(payload_fixture)
+        register_mock(endpoint, payload)
+
+        results = getattr(sync_client, f"{method_name}_sync")(**kwargs)
+
+        assert [result.url for result in results] == [item["url"] for item in payload]
+
+    def test_sync_calls_share_event_loop(self, register_mock, api_key):
+        """Test repeated sync calls reuse one background loop and connection pool."""
+        register_mock("/search", [])
+        register_mock("/search", [])
 
         client = PostCrawlClient(api_key=api_key)
-        try:
-            results = await client.search_and_extract(
-                social_platforms=["reddit", "tiktok"], query="test", results=10, page=1
-            )
-            assert len(results) == 2
-        finally:
-            await client.close()
+        client.search_sync(social_platforms=["reddit"], query="first", results=10, page=1)
+        loop, http_client = client._sync_loop, client._sync_client
+        client.search_sync(social_platforms=["reddit"], query="second", results=10, page=1)
+
+        assert loop is not None and loop.is_running()
+        assert client._sync_loop is loop
+        assert http_client is not None
+        assert client._sync_client is http_client
+        assert client._client is None
 
+        client.close_sync()
+        assert loop.is_closed()
+        assert client._sync_loop is None
+        assert client._sync_client is None
 
-class TestSyncMethods:
-    """Test sync wrapper methods."""
+    def test_sync_call_from_background_loop_raises(self, sync_client):
+        """Test a sync call made on the background loop raises instead of deadlocking."""
 
-    def test_sync_search(self, httpx_mock: HTTPXMock, api_key, mock_search_response):
-        """Test sync search wrapper."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=mock_search_response,
-            status_code=200,
-        )
+        async def nested() -> None:
+            sync_client.search_sync(social_platforms=["reddit"], query="q", results=10, page=1)
+
+        with pytest.raises(RuntimeError, match="await the async method"):
+            sync_client._run_sync(nested())
+
+    def test_unclosed_sync_client_is_cleaned_up(self, register_mock, api_key):
+        """Test dropping a client that only used sync calls closes its loop and HTTP client."""
+        register_mock("/search", [])
 
         client = PostCrawlClient(api_key=api_key)
-        results = client.search_sync(social_platforms=["reddit"], query="test", results=10, page=1)
+        client.search_sync(social_platforms=["reddit"], query="q", results=10, page=1)
+        loop, http_client = client._sync_loop, client._sync_client
+        del client
+        gc.collect()
 
-        assert len(results) == 2
-        assert results[0].title == "Understanding Machine Learning Basics"
+        assert loop is not None and loop.is_closed()
+        assert http_client is not None and http_client.is_closed
 
-    def test_sync_extract(self, httpx_mock: HTTPXMock, api_key, mock_extract_response):
-        """Test sync extract wrapper."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/extract",
-            json=mock_extract_response,
-            status_code=200,
-        )
+    def test_async_context_exit_stops_sync_loop(self, register_mock, api_key):
+        """Test leaving an async with block also shuts down the sync background loop."""
+        register_mock("/search", [])
 
         client = PostCrawlClient(api_key=api_key)
-        results = client.extract_sync(
-            urls=[
-                "https://www.reddit.com/r/test/comments/123/",
-                "https://www.tiktok.com/@user/video/456",
-            ]
-        )
+        client.search_sync(social_platforms=["reddit"], query="q", results=10, page=1)
+        loop = client._sync_loop
 
-        assert len(results) == 3
-        assert results[0].source == "reddit"
-        assert results[1].source == "tiktok"
+        async def use_client() -> None:
+            async with client:
+                pass
 
-    def test_sync_search_and_extract(self, httpx_mock: HTTPXMock, api_key, mock_extract_response):
-        """Test sync search_and_extract wrapper."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search-and-extract",
-            json=mock_extract_response[:2],
-            status_code=200,
-        )
+        asyncio.run(use_client())
+
+        assert loop is not None and loop.is_closed()
+        assert client._sync_loop is None
+        assert client._sync_client is None
+
+    def test_sync_call_wait_is_bounded(self, sync_client, monkeypatch):
+        """Test a sync call stops waiting when the background loop doesn't answer."""
+        monkeypatch.setattr(sync_client, "_sync_result_timeout", lambda: 0.05)
+
+        with pytest.raises(TimeoutError, match="background event loop"):
+            sync_client._run_sync(asyncio.sleep(10))
+
+    def test_sync_result_timeout(self, api_key):
+        """Test the sync wait covers every attempt and is unbounded without a timeout."""
+        assert PostCrawlClient(api_key=api_key, timeout=None)._sync_result_timeout() is None
+        client = PostCrawlClient(api_key=api_key, timeout=10, max_retries=2)
+        assert client._sync_result_timeout() == (10 + 30) * 3 + 5
+
+    def test_sync_and_async_calls_on_one_client(self, register_mock, api_key):
+        """Test sync and async calls can be interleaved on the same client."""
+        for _ in range(4):
+            register_mock("/search", [])
 
         client = PostCrawlClient(api_key=api_key)
-        results = client.search_and_extract_sync(
-            social_platforms=["reddit", "tiktok"],
-            query="python tutorial",
-            results=10,
-            page=1,
-            include_comments=True,
-        )
 
-        assert len(results) == 2
-        assert all(hasattr(post, "url") for post in results)
+        async def search_async(query: str) -> None:
+            await client.search(social_platforms=["reddit"], query=query, results=10, page=1)
+            await client.close()
+
+        client.search_sync(social_platforms=["reddit"], query="first", results=10, page=1)
+        sync_http_client = client._sync_client
+        asyncio.run(search_async("second"))
+        client.search_sync(social_platforms=["reddit"], query="third", results=10, page=1)
+        asyncio.run(search_async("fourth"))
+
+        # Closing after each awaited call only touches the caller's client
+        assert client._client is None
+        assert sync_http_client is not None and not sync_http_client.is_closed
+        assert client._sync_client is sync_http_client
+        client.close_sync()
+        assert sync_http_client.is_closed
+        assert client._sync_client is None
 
 
 class TestAsyncContextManager:
     """Test async context manager functionality."""
 
+    @pytest.mark.endpoint("/search")
     @pytest.mark.asyncio
-    async def test_async_context_manager_success(self, httpx_mock: HTTPXMock, api_key):
+    async def test_async_context_manager_success(self, api_key):
         """Test using client as async context manager."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[],
-            status_code=200,
-        )
-
         async with PostCrawlClient(api_key=api_key) as client:
             results = await client.search(
                 social_platforms=["reddit"], query="test", results=10, page=1
@@ -172,13 +206,12 @@ class TestAsyncContextManager:
         assert client._client is None
 
     @pytest.mark.asyncio
-    async def test_multiple_requests_in_context(self, httpx_mock: HTTPXMock, api_key):
+    async def test_multiple_requests_in_context(self, register_mock, api_key):
         """Test multiple requests within same context."""
         # Mock multiple responses
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[
+        register_mock(
+            "/search",
+            [
                 {
                     "title": "Result 1",
                     "url": "https://example.com/1",
@@ -187,12 +220,10 @@ class TestAsyncContextManager:
                     "imageUrl": "",  # This is correct - the API uses camelCase
                 }
             ],
-            status_code=200,
         )
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/extract",
-            json=[
+        register_mock(
+            "/extract",
+            [
                 {
                     "url": "https://example.com/1",
                     "source": "reddit",
@@ -201,7 +232,6 @@ class TestAsyncContextManager:
                     "error": None,
                 }
             ],
-            status_code=200,
         )
 
         async with PostCrawlClient(api_key=api_key) as client:
@@ -223,53 +253,88 @@ class TestAsyncConcurrency:
     """Test concurrent async operations."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_requests(self, httpx_mock: HTTPXMock, api_key):
+    async def test_concurrent_requests(self, httpx_mock: HTTPXMock, client):
         """Test making concurrent requests."""
-        # Mock responses for concurrent requests
-        for i in range(3):
-            httpx_mock.add_response(
-                method="POST",
-                url="https://edge.postcrawl.com/v1/search",
+        # One reusable callback serves the responses in order, instead of one
+        # registered mock per request that pytest-httpx has to scan through
+        responses = iter(
+            [
+                {
+                    "title": f"Result {i}",
+                    "url": f"https://example.com/{i}",
+                    "snippet": f"Test {i}",
+                    "date": "Dec 28, 2024",
+                    "imageUrl": "",
+                }
+            ]
+            for i in range(3)
+        )
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(status_code=200, json=next(responses)),
+            method="POST",
+            url=API_URLS["/search"],
+            is_reusable=True,
+        )
+
+        # Create concurrent tasks
+        tasks = [
+            client.search(social_platforms=["reddit"], query=f"query {i}", results=10, page=1)
+            for i in range(3)
+        ]
+
+        # Execute concurrently
+        results = await asyncio.gather(*tasks)
+
+        assert len(results) == 3
+        for i, result_list in enumerate(results):
+            assert len(result_list) == 1
+            assert result_list[0].title == f"Result {i}"
+
+    @pytest.mark.asyncio
+    async def test_many_concurrent_requests(self, httpx_mock: HTTPXMock, client):
+        """Test a burst of 100 concurrent requests on one client all complete."""
+
+        def echo_query(request: httpx.Request) -> httpx.Response:
+            query = json.loads(request.content)["query"]
+            return httpx.Response(
+                status_code=200,
                 json=[
                     {
-                        "title": f"Result {i}",
-                        "url": f"https://example.com/{i}",
-                        "snippet": f"Test {i}",
-                        "date": "Dec 28, 2024",
+                        "title": query,
+                        "url": "https://example.com",
+                        "snippet": "",
+                        "date": "",
                         "imageUrl": "",
                     }
                 ],
-                status_code=200,
             )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            # Create concurrent tasks
-            tasks = [
-                client.search(social_platforms=["reddit"], query=f"query {i}", results=10, page=1)
-                for i in range(3)
-            ]
-
-            # Execute concurrently
-            results = await asyncio.gather(*tasks)
-
-            assert len(results) == 3
-            for i, result_list in enumerate(results):
-                assert len(result_list) == 1
-                assert result_list[0].title == f"Result {i}"
-
-    def test_sync_method_outside_async_context(self, httpx_mock: HTTPXMock, api_key):
-        """Test that sync methods work outside async context."""
-        httpx_mock.add_response(
+        httpx_mock.add_callback(
+            echo_query,
             method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[],
-            status_code=200,
+            url=API_URLS["/search"],
+            is_reusable=True,
         )
 
-        client = PostCrawlClient(api_key=api_key)
+        results = await asyncio.gather(
+            *(
+                client.search(social_platforms=["reddit"], query=f"query {i}", results=10, page=1)
+                for i in range(100)
+            )
+        )
+
+        assert [result_list[0].title for result_list in results] == [
+            f"query {i}" for i in range(100)
+        ]
+        assert len(httpx_mock.get_requests()) == 100
 
+    @pytest.mark.endpoint("/search")
+    def test_sync_method_outside_async_context(self, sync_client):
+        """Test that sync methods work outside async context."""
         # This should work in a regular sync context
-        results = client.search_sync(social_platforms=["reddit"], query="test", results=10, page=1)
+        results = sync_client.search_sync(
+            social_platforms=["reddit"], query="test", results=10, page=1
+        )
 
         assert results == []
 
@@ -278,32 +343,199 @@ class TestAsyncErrorHandling:
     """Test error handling in async context."""
 
     @pytest.mark.asyncio
-    async def test_async_network_error_retry(self, httpx_mock: HTTPXMock, api_key):
+    async def test_async_network_error_retry(self, httpx_mock: HTTPXMock, register_mock, client):
         """Test network error retry in async context."""
         # First request fails with httpx NetworkError
         httpx_mock.add_exception(httpx.NetworkError("Connection failed"))
 
         # Retry succeeds
+        register_mock("/search", [])
+
+        results = await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_handling(self, httpx_mock: HTTPXMock, client):
+        """Test timeout handling in async operations."""
+        httpx_mock.add_exception(httpx.TimeoutException("Request timed out"))
+
+        with pytest.raises(TimeoutError):
+            await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+
+
+class TestExtractStream:
+    """Test batched, streaming extraction."""
+
+    @staticmethod
+    def _echo_extract(request: httpx.Request) -> httpx.Response:
+        """Return one extracted post per requested URL."""
+        urls = json.loads(request.content)["urls"]
+        return httpx.Response(
+            status_code=200,
+            json=[
+                {"url": url, "source": "reddit", "raw": None, "markdown": None, "error": None}
+                for url in urls
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_extract_stream_batches(self, httpx_mock: HTTPXMock, client):
+        """Test URLs are split into batches and every post is yielded."""
+        urls = [f"https://www.reddit.com/r/test/comments/{i}/" for i in range(25)]
+        httpx_mock.add_callback(
+            self._echo_extract,
+            method="POST",
+            url=API_URLS["/extract"],
+            is_reusable=True,
+        )
+
+        posts = [
+            post
+            async for post in client.extract_stream(urls=urls, batch_size=10, max_concurrency=2)
+        ]
+
+        assert sorted(post.url for post in posts) == sorted(urls)
+        batch_sizes = sorted(len(json.loads(r.content)["urls"]) for r in httpx_mock.get_requests())
+        assert batch_sizes == [5, 10, 10]
+
+    @pytest.mark.asyncio
+    async def test_extract_stream_drops_duplicates_across_batches(
+        self, httpx_mock: HTTPXMock, client
+    ):
+        """Test a URL repeated in different batches is only extracted once."""
+        first, second = (f"https://www.reddit.com/r/test/comments/{i}/" for i in range(2))
+        httpx_mock.add_callback(
+            self._echo_extract,
+            method="POST",
+            url=API_URLS["/extract"],
+            is_reusable=True,
+        )
+
+        posts = [
+            post async for post in client.extract_stream(urls=[first, second, first], batch_size=2)
+        ]
+
+        assert [post.url for post in posts] == [first, second]
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_extract_stream_empty_urls(self, client):
+        """Test an empty URL list is rejected like extract(urls=[])."""
+        with pytest.raises(ValidationError):
+            async for _ in client.extract_stream(urls=[]):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_extract_stream_invalid_url_in_later_batch(self, httpx_mock: HTTPXMock, client):
+        """Test an invalid URL in any batch fails before a request is sent."""
+        urls = [f"https://www.reddit.com/r/test/comments/{i}/" for i in range(3)]
+
+        with pytest.raises(ValidationError, match="Invalid request parameters"):
+            async for _ in client.extract_stream(urls=[*urls, "not-a-url"], batch_size=2):
+                pass
+        assert httpx_mock.get_requests() == []
+
+    @pytest.mark.asyncio
+    async def test_extract_stream_error_propagates(self, register_mock, client):
+        """Test an API error in one batch is raised to the caller."""
+        register_mock(
+            "/extract",
+            {"error": "insufficient_credits", "message": "Not enough credits"},
+            status=403,
+        )
+
+        with pytest.raises(InsufficientCreditsError):
+            async for _ in client.extract_stream(
+                urls=["https://www.reddit.com/r/test/comments/1/"]
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_extract_stream_invalid_batch_size(self, client):
+        """Test batch_size must be positive."""
+        with pytest.raises(ValueError, match="batch_size"):
+            async for _ in client.extract_stream(
+                urls=["https://www.reddit.com/r/test/comments/1/"], batch_size=0
+            ):
+                pass
+
+
+class TestIterExtract:
+    """Test incremental parsing of extract responses."""
+
+    @staticmethod
+    def _chunked(data, size: int = 64) -> IteratorStream:
+        """Split a JSON body into small chunks so items span chunk boundaries."""
+        body = json.dumps(list(data)).encode()
+        return IteratorStream([body[i : i + size] for i in range(0, len(body), size)])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ijson_available", [True, False])
+    async def test_iter_extract(
+        self, httpx_mock: HTTPXMock, client, mock_extract_response, monkeypatch, ijson_available
+    ):
+        """Test posts are parsed from a chunked body, with and without ijson."""
+        if ijson_available:
+            pytest.importorskip("ijson")
+        monkeypatch.setattr("postcrawl.client._IJSON_AVAILABLE", ijson_available)
         httpx_mock.add_response(
             method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[],
+            url=API_URLS["/extract"],
+            stream=self._chunked(mock_extract_response),
             status_code=200,
         )
 
-        async with PostCrawlClient(api_key=api_key, retry_delay=0.01) as client:
-            results = await client.search(
-                social_platforms=["reddit"], query="test", results=10, page=1
+        posts = [
+            post
+            async for post in client.iter_extract(
+                urls=["https://www.reddit.com/r/Python/comments/1ab2c3d/test_post/"]
             )
-            assert results == []
+        ]
+
+        assert [post.url for post in posts] == [item["url"] for item in mock_extract_response]
+        assert posts[0].is_reddit_post()
+        assert posts[0].raw.upvotes == 42.0
+        assert posts[1].is_tiktok_post()
+        assert posts[2].error == "Failed to extract content: Invalid URL"
 
     @pytest.mark.asyncio
-    async def test_async_timeout_handling(self, httpx_mock: HTTPXMock, api_key):
-        """Test timeout handling in async operations."""
-        import httpx
+    @pytest.mark.parametrize("ijson_available", [True, False])
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param(b'{"oops": 1}', id="not_an_array"),
+            pytest.param(b"", id="empty"),
+            pytest.param(b'[{"url": "https://www.reddit.com/r/test/comments/1/"', id="truncated"),
+        ],
+    )
+    async def test_iter_extract_invalid_body(
+        self, httpx_mock: HTTPXMock, client, monkeypatch, ijson_available, body
+    ):
+        """Test a malformed response body raises APIError with and without ijson."""
+        if ijson_available:
+            pytest.importorskip("ijson")
+        monkeypatch.setattr("postcrawl.client._IJSON_AVAILABLE", ijson_available)
+        httpx_mock.add_response(
+            method="POST",
+            url=API_URLS["/extract"],
+            stream=IteratorStream([body[i : i + 8] for i in range(0, len(body), 8)]),
+            status_code=200,
+        )
 
-        httpx_mock.add_exception(httpx.TimeoutException("Request timed out"))
+        with pytest.raises(APIError, match="Invalid response body") as exc_info:
+            async for _ in client.iter_extract(urls=["https://www.reddit.com/r/test/comments/1/"]):
+                pass
+        assert exc_info.value.status_code == 200
 
-        async with PostCrawlClient(api_key=api_key, timeout=1.0) as client:
-            with pytest.raises(TimeoutError):
-                await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+    @pytest.mark.asyncio
+    async def test_iter_extract_error(self, register_mock, client):
+        """Test an API error response is raised before any post is yielded."""
+        register_mock(
+            "/extract",
+            {"error": "insufficient_credits", "message": "Not enough credits"},
+            status=403,
+        )
+
+        with pytest.raises(InsufficientCreditsError, match="Not enough credits"):
+            async for _ in client.iter_extract(urls=["https://www.reddit.com/r/test/comments/1/"]):
+                pass
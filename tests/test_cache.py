@@ -0,0 +1,186 @@
+"""
+Tests for response caching.
+"""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from postcrawl import Cache, InMemoryLRUCache, PostCrawlClient, RedisCache
+from postcrawl.cache import make_cache_key
+from postcrawl.exceptions import AuthenticationError
+
+
+class FakeRedis:
+    """Minimal stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+        self.expiry: dict[str, int | None] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, px=None):
+        self.store[key] = value
+        self.expiry[key] = px
+
+
+class TestInMemoryLRUCache:
+    """Test the in-process LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_set(self):
+        """Test storing and reading back a value."""
+        cache = InMemoryLRUCache()
+        assert await cache.get("a") is None
+
+        await cache.set("a", b"1")
+        assert await cache.get("a") == b"1"
+        assert isinstance(cache, Cache)
+
+    @pytest.mark.asyncio
+    async def test_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = InMemoryLRUCache(maxsize=2)
+        await cache.set("a", b"1")
+        await cache.set("b", b"2")
+        await cache.get("a")
+        await cache.set("c", b"3")
+
+        assert len(cache) == 2
+        assert await cache.get("a") == b"1"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == b"3"
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, monkeypatch):
+        """Test that entries expire after their TTL."""
+        now = 1000.0
+        monkeypatch.setattr("postcrawl.cache.time.monotonic", lambda: now)
+
+        cache = InMemoryLRUCache()
+        await cache.set("a", b"1", ttl=10)
+        assert await cache.get("a") == b"1"
+
+        now += 10
+        assert await cache.get("a") is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_non_positive_ttl_not_stored(self):
+        """Test that an entry with a TTL that has already run out is not stored."""
+        cache = InMemoryLRUCache()
+        await cache.set("a", b"1", ttl=0)
+        await cache.set("b", b"2", ttl=-1)
+
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        """Test that maxsize must be positive."""
+        with pytest.raises(ValueError, match="maxsize"):
+            InMemoryLRUCache(maxsize=0)
+
+
+class TestRedisCache:
+    """Test the Redis-backed cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_set(self):
+        """Test that values are prefixed and TTLs are passed in milliseconds."""
+        redis = FakeRedis()
+        cache = RedisCache(redis)
+
+        await cache.set("a", b"1", ttl=1.5)
+        assert redis.store == {"postcrawl:a": b"1"}
+        assert redis.expiry == {"postcrawl:a": 1500}
+        assert await cache.get("a") == b"1"
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_ttl_edge_cases(self):
+        """Test that sub-millisecond TTLs round up and non-positive TTLs skip the write."""
+        redis = FakeRedis()
+        cache = RedisCache(redis)
+
+        await cache.set("short", b"1", ttl=0.0004)
+        await cache.set("zero", b"2", ttl=0)
+        await cache.set("negative", b"3", ttl=-5)
+
+        assert redis.expiry == {"postcrawl:short": 1}
+
+
+class TestClientCaching:
+    """Test caching in PostCrawlClient."""
+
+    @pytest.mark.parametrize("cache_ttl", [0, -1])
+    def test_invalid_cache_ttl(self, api_key, cache_ttl):
+        """Test that cache_ttl must be positive."""
+        with pytest.raises(ValueError, match="cache_ttl"):
+            PostCrawlClient(api_key=api_key, cache=InMemoryLRUCache(), cache_ttl=cache_ttl)
+
+    def test_cache_key_ignores_platform_order(self):
+        """Test that platform order does not change the cache key."""
+        base = {"query": "test", "results": 10, "page": 1}
+        key1 = make_cache_key(
+            "k", "u", "/search", {**base, "social_platforms": ["reddit", "tiktok"]}
+        )
+        key2 = make_cache_key(
+            "k", "u", "/search", {**base, "social_platforms": ["tiktok", "reddit"]}
+        )
+        key3 = make_cache_key("k", "u", "/search", {**base, "social_platforms": ["reddit"]})
+
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_cache_key_depends_on_api_key(self):
+        """Test that the same request made with another API key gets its own key."""
+        payload = {"social_platforms": ["reddit"], "query": "test", "results": 10, "page": 1}
+
+        assert make_cache_key("k1", "u", "/search", payload) != make_cache_key(
+            "k2", "u", "/search", payload
+        )
+
+    @pytest.mark.endpoint("/search", "mock_search_response")
+    @pytest.mark.asyncio
+    async def test_search_served_from_cache(self, httpx_mock: HTTPXMock, api_key):
+        """Test that a repeated search only hits the network once."""
+        async with PostCrawlClient(api_key=api_key, cache=InMemoryLRUCache()) as client:
+            first = await client.search(
+                social_platforms=["reddit", "tiktok"], query="test", results=10, page=1
+            )
+            second = await client.search(
+                social_platforms=["tiktok", "reddit"], query="test", results=10, page=1
+            )
+
+        assert first == second
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_not_served_across_api_keys(self, register_mock, api_key):
+        """Test that a cache shared by clients with different API keys keeps them apart."""
+        cache = InMemoryLRUCache()
+        register_mock("/search", [])
+        register_mock("/search", {"error": "unauthorized", "message": "Invalid API key"}, 401)
+
+        async with PostCrawlClient(api_key=api_key, cache=cache) as client:
+            await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+
+        async with PostCrawlClient(api_key="sk_other", cache=cache) as other:
+            with pytest.raises(AuthenticationError):
+                await other.search(social_platforms=["reddit"], query="test", results=10, page=1)
+
+    @pytest.mark.asyncio
+    async def test_search_and_extract_served_from_cache(
+        self, httpx_mock: HTTPXMock, register_mock, api_key, mock_extract_response
+    ):
+        """Test that a repeated search_and_extract only hits the network once."""
+        register_mock("/search-and-extract", mock_extract_response[:2])
+
+        async with PostCrawlClient(api_key=api_key, cache=InMemoryLRUCache()) as client:
+            for _ in range(2):
+                results = await client.search_and_extract(
+                    social_platforms=["reddit"], query="test", results=10, page=1
+                )
+                assert len(results) == 2
+
+        assert len(httpx_mock.get_requests()) == 1
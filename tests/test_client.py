@@ -2,11 +2,15 @@
 Tests for PostCrawl client functionality.
 """
 
+import json
+
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from postcrawl import PostCrawlClient
+from postcrawl.client import _backoff_delay, _validate_request
+from postcrawl.constants import DEFAULT_MAX_RETRY_DELAY
 from postcrawl.exceptions import (
     APIError,
     AuthenticationError,
@@ -16,7 +20,69 @@ from postcrawl.exceptions import (
     TimeoutError,
     ValidationError,
 )
-from postcrawl.types import ExtractedPost, SearchResult
+from postcrawl.types import (
+    _EXTRACT_REQUEST_ADAPTER,
+    _SEARCH_REQUEST_ADAPTER,
+    ErrorDetail,
+    ExtractedPost,
+    SearchRequest,
+    SearchResult,
+)
+
+from .conftest import API_URLS
+
+# (status, error body, response headers, expected exception, expected attributes)
+HTTP_ERROR_CASES = [
+    (
+        401,
+        {"error": "unauthorized", "message": "Invalid API key", "request_id": "req_123"},
+        None,
+        AuthenticationError,
+        {},
+    ),
+    (
+        403,
+        {
+            "error": "insufficient_credits",
+            "message": "Not enough credits. Required: 10, Available: 5",
+            "request_id": "req_789",
+        },
+        None,
+        InsufficientCreditsError,
+        {},
+    ),
+    (
+        422,
+        {
+            "error": "validation_error",
+            "message": "Validation failed",
+            "request_id": "req_val_123",
+            "details": [
+                {
+                    "field": "results",
+                    "code": "invalid_value",
+                    "message": "Must be between 1 and 100",
+                }
+            ],
+        },
+        None,
+        ValidationError,
+        {
+            "details": [
+                ErrorDetail(
+                    field="results", code="invalid_value", message="Must be between 1 and 100"
+                )
+            ]
+        },
+    ),
+    (
+        429,
+        {"error": "rate_limit_exceeded", "message": "Too many requests", "request_id": "req_456"},
+        {"Retry-After": "60"},
+        RateLimitError,
+        {"retry_after": 60},
+    ),
+]
 
 
 class TestClientInitialization:
@@ -30,6 +96,9 @@ class TestClientInitialization:
         assert client.timeout is None  # No timeout by default
         assert client.max_retries == 3
         assert client.retry_delay == 1.0
+        assert client.connect_timeout is None
+        assert client.max_connections == 100
+        assert client.max_keepalive_connections == 100
 
     def test_invalid_api_key_format(self):
         """Test initialization with invalid API key format."""
@@ -48,18 +117,85 @@ class TestClientInitialization:
         assert client.max_retries == 5
         assert client.retry_delay == 2.0
 
+    def test_connection_pool_parameters(self, api_key):
+        """Test connection pool and timeout settings are passed to httpx."""
+        client = PostCrawlClient(
+            api_key=api_key,
+            timeout=30.0,
+            connect_timeout=5.0,
+            max_connections=50,
+            max_keepalive_connections=10,
+        )
+        http_client = client._get_client()
+
+        assert http_client.timeout.read == 30.0
+        assert http_client.timeout.connect == 5.0
+        pool = http_client._transport._pool
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 10
+        assert pool._keepalive_expiry == 30.0
+
+    def test_http2_enabled(self, api_key):
+        """Test HTTP/2 is negotiated by default when h2 is installed."""
+        pytest.importorskip("h2")
+
+        client = PostCrawlClient(api_key=api_key)
+        assert client.http2 is True
+        assert client._get_client()._transport._pool._http2 is True
+
+    def test_http2_fallback_without_h2(self, api_key, monkeypatch):
+        """Test the client falls back to HTTP/1.1 when h2 is not installed."""
+        monkeypatch.setattr("postcrawl.client._HTTP2_AVAILABLE", False)
+
+        client = PostCrawlClient(api_key=api_key)
+        assert client.http2 is False
+        assert client._get_client()._transport._pool._http2 is False
+
+    def test_connection_pool_env_overrides(self, api_key, monkeypatch):
+        """Test connection pool limits can be set through environment variables."""
+        monkeypatch.setenv("POSTCRAWL_MAX_CONNECTIONS", "200")
+        monkeypatch.setenv("POSTCRAWL_MAX_KEEPALIVE", "40")
+
+        client = PostCrawlClient(api_key=api_key)
+        assert client.max_connections == 200
+        assert client.max_keepalive_connections == 40
+
+        # Explicit arguments win over the environment
+        client = PostCrawlClient(api_key=api_key, max_connections=5)
+        assert client.max_connections == 5
+
+    def test_base_url_env_override(self, api_key, monkeypatch):
+        """Test POSTCRAWL_API_URL is read each time a client is created."""
+        monkeypatch.setenv("POSTCRAWL_API_URL", "http://localhost:8787/")
+
+        client = PostCrawlClient(api_key=api_key)
+        assert client.base_url == "http://localhost:8787"
+        assert str(client._get_client().base_url) == "http://localhost:8787"
+
+        # Explicit arguments win over the environment
+        client = PostCrawlClient(api_key=api_key, base_url="https://staging.postcrawl.com")
+        assert client.base_url == "https://staging.postcrawl.com"
+
+        monkeypatch.delenv("POSTCRAWL_API_URL")
+        assert PostCrawlClient(api_key=api_key).base_url == "https://edge.postcrawl.com"
+
+    def test_connection_pool_env_invalid(self, api_key, monkeypatch):
+        """Test a non-integer environment override is rejected."""
+        monkeypatch.setenv("POSTCRAWL_MAX_CONNECTIONS", "lots")
+
+        with pytest.raises(ValueError, match="POSTCRAWL_MAX_CONNECTIONS"):
+            PostCrawlClient(api_key=api_key)
+
 
 class TestSearchEndpoint:
     """Test search endpoint functionality."""
 
     @pytest.mark.asyncio
-    async def test_search_success(self, httpx_mock: HTTPXMock, api_key, mock_search_response):
+    async def test_search_success(self, register_mock, client, mock_search_response):
         """Test successful search request."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=mock_search_response,
-            status_code=200,
+        register_mock(
+            "/search",
+            mock_search_response,
             headers={
                 "X-RateLimit-Limit": "200",
                 "X-RateLimit-Remaining": "199",
@@ -67,10 +203,9 @@ class TestSearchEndpoint:
             },
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            results = await client.search(
-                social_platforms=["reddit"], query="machine learning", results=10, page=1
-            )
+        results = await client.search(
+            social_platforms=["reddit"], query="machine learning", results=10, page=1
+        )
 
         assert len(results) == 2
         assert isinstance(results[0], SearchResult)
@@ -84,106 +219,96 @@ class TestSearchEndpoint:
         assert client.rate_limit_info["limit"] == 200
         assert client.rate_limit_info["remaining"] == 199
 
+    @pytest.mark.endpoint("/search")
     @pytest.mark.asyncio
-    async def test_search_empty_results(self, httpx_mock: HTTPXMock, api_key):
+    async def test_search_empty_results(self, client):
         """Test search with no results."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[],
-            status_code=200,
+        results = await client.search(
+            social_platforms=["reddit", "tiktok"],
+            query="very specific query with no results",
+            results=10,
+            page=1,
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            results = await client.search(
-                social_platforms=["reddit", "tiktok"],
-                query="very specific query with no results",
-                results=10,
-                page=1,
-            )
-
         assert results == []
         assert isinstance(results, list)
 
     @pytest.mark.asyncio
-    async def test_search_validation_error(self, api_key):
-        """Test search with invalid parameters."""
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(ValidationError) as exc_info:
-                await client.search(
-                    social_platforms=[],
-                    query="test",
-                    results=10,
-                    page=1,  # Empty list
-                )
-
-            assert "Invalid request parameters" in str(exc_info.value)
-            assert exc_info.value.details[0].field == "social_platforms"
+    @pytest.mark.endpoint("/search")
+    async def test_search_request_body(self, httpx_mock: HTTPXMock, client):
+        """Test the request body is the serialized model, sent as JSON."""
+        await client.search(social_platforms=["reddit"], query=" ai ", results=5, page=2)
+
+        request = httpx_mock.get_request()
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "social_platforms": ["reddit"],
+            "query": "ai",
+            "results": 5,
+            "page": 2,
+        }
 
     @pytest.mark.asyncio
-    async def test_search_authentication_error(self, httpx_mock: HTTPXMock, api_key):
-        """Test search with authentication error."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json={"error": "unauthorized", "message": "Invalid API key", "request_id": "req_123"},
-            status_code=401,
-        )
+    async def test_search_validation_error(self, client):
+        """Test search with invalid parameters."""
+        with pytest.raises(ValidationError) as exc_info:
+            await client.search(
+                social_platforms=[],
+                query="test",
+                results=10,
+                page=1,  # Empty list
+            )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(AuthenticationError) as exc_info:
-                await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        assert "Invalid request parameters" in str(exc_info.value)
+        assert exc_info.value.details[0].field == "social_platforms"
 
-            assert exc_info.value.status_code == 401
-            assert exc_info.value.request_id == "req_123"
 
-    @pytest.mark.asyncio
-    async def test_search_rate_limit_error(self, httpx_mock: HTTPXMock, api_key):
-        """Test search with rate limit error."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json={
-                "error": "rate_limit_exceeded",
-                "message": "Too many requests",
-                "request_id": "req_456",
-            },
-            status_code=429,
-            headers={"Retry-After": "60"},
+class TestRequestValidation:
+    """Test request validation, which runs before anything is sent (no event loop needed)."""
+
+    def test_valid_request(self):
+        """Test valid parameters return the request model."""
+        request = _validate_request(
+            _SEARCH_REQUEST_ADAPTER,
+            {"social_platforms": ["reddit"], "query": " test ", "results": 10, "page": 1},
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(RateLimitError) as exc_info:
-                await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        assert isinstance(request, SearchRequest)
+        assert request.query == "test"
+
+    def test_invalid_request_details(self):
+        """Test each invalid field is reported with its dotted location."""
+        with pytest.raises(ValidationError) as exc_info:
+            _validate_request(
+                _EXTRACT_REQUEST_ADAPTER,
+                {"urls": ["not-a-valid-url"], "comment_filter_config": {"min_score": "high"}},
+            )
 
-            assert exc_info.value.status_code == 429
-            assert exc_info.value.retry_after == 60
+        assert exc_info.value.message == "Invalid request parameters"
+        assert {detail.field for detail in exc_info.value.details} == {
+            "urls",
+            "comment_filter_config.min_score",
+        }
+        assert all(detail.code == "invalid_value" for detail in exc_info.value.details)
 
 
 class TestExtractEndpoint:
     """Test extract endpoint functionality."""
 
+    @pytest.mark.endpoint("/extract", "mock_extract_response")
     @pytest.mark.asyncio
-    async def test_extract_success(self, httpx_mock: HTTPXMock, api_key, mock_extract_response):
+    async def test_extract_success(self, client):
         """Test successful extract request."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/extract",
-            json=mock_extract_response,
-            status_code=200,
+        results = await client.extract(
+            urls=[
+                "https://www.reddit.com/r/Python/comments/1ab2c3d/test_post/",
+                "https://www.tiktok.com/@pythontutor/video/7123456789012345678",
+                "https://invalid.url/post",
+            ],
+            include_comments=True,
+            response_mode="raw",
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            results = await client.extract(
-                urls=[
-                    "https://www.reddit.com/r/Python/comments/1ab2c3d/test_post/",
-                    "https://www.tiktok.com/@pythontutor/video/7123456789012345678",
-                    "https://invalid.url/post",
-                ],
-                include_comments=True,
-                response_mode="raw",
-            )
-
         assert len(results) == 3
 
         # Check Reddit post
@@ -208,7 +333,7 @@ class TestExtractEndpoint:
         assert failed_post.error == "Failed to extract content: Invalid URL"
 
     @pytest.mark.asyncio
-    async def test_extract_with_markdown(self, httpx_mock: HTTPXMock, api_key):
+    async def test_extract_with_markdown(self, register_mock, client):
         """Test extract with markdown response mode."""
         markdown_response = [
             {
@@ -220,81 +345,43 @@ class TestExtractEndpoint:
             }
         ]
 
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/extract",
-            json=markdown_response,
-            status_code=200,
-        )
+        register_mock("/extract", markdown_response)
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            results = await client.extract(
-                urls=["https://www.reddit.com/r/Python/comments/1ab2c3d/test_post/"],
-                response_mode="markdown",
-            )
+        results = await client.extract(
+            urls=["https://www.reddit.com/r/Python/comments/1ab2c3d/test_post/"],
+            response_mode="markdown",
+        )
 
         assert len(results) == 1
         assert results[0].markdown == "# Test Post Title\\n\\nThis is the post content."
         assert results[0].raw is None
 
     @pytest.mark.asyncio
-    async def test_extract_url_validation(self, api_key):
+    async def test_extract_url_validation(self, client):
         """Test extract with invalid URLs."""
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(ValidationError) as exc_info:
-                await client.extract(urls=["not-a-valid-url"], include_comments=False)
-
-            assert "Invalid request parameters" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_extract_insufficient_credits(self, httpx_mock: HTTPXMock, api_key):
-        """Test extract with insufficient credits error."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/extract",
-            json={
-                "error": "insufficient_credits",
-                "message": "Not enough credits. Required: 10, Available: 5",
-                "request_id": "req_789",
-            },
-            status_code=403,
-        )
+        with pytest.raises(ValidationError) as exc_info:
+            await client.extract(urls=["not-a-valid-url"], include_comments=False)
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(InsufficientCreditsError) as exc_info:
-                await client.extract(
-                    urls=["https://www.reddit.com/r/Python/comments/1ab2c3d/test/"]
-                )
-
-            assert exc_info.value.status_code == 403
-            assert "Not enough credits" in str(exc_info.value)
+        assert "Invalid request parameters" in str(exc_info.value)
 
 
 class TestSearchAndExtractEndpoint:
     """Test search-and-extract endpoint functionality."""
 
     @pytest.mark.asyncio
-    async def test_search_and_extract_success(
-        self, httpx_mock: HTTPXMock, api_key, mock_extract_response
-    ):
+    async def test_search_and_extract_success(self, register_mock, client, mock_extract_response):
         """Test successful search-and-extract request."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search-and-extract",
-            json=mock_extract_response[:2],  # Return first 2 items
-            status_code=200,
+        register_mock("/search-and-extract", mock_extract_response[:2])  # First 2 items
+
+        results = await client.search_and_extract(
+            social_platforms=["reddit", "tiktok"],
+            query="python tutorial",
+            results=10,
+            page=1,
+            include_comments=True,
+            response_mode="raw",
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            results = await client.search_and_extract(
-                social_platforms=["reddit", "tiktok"],
-                query="python tutorial",
-                results=10,
-                page=1,
-                include_comments=True,
-                response_mode="raw",
-            )
-
         assert len(results) == 2
         assert all(isinstance(post, ExtractedPost) for post in results)
         assert results[0].source == "reddit"
@@ -305,23 +392,15 @@ class TestNetworkAndRetry:
     """Test network errors and retry logic."""
 
     @pytest.mark.asyncio
-    async def test_network_error_with_retry(self, httpx_mock: HTTPXMock, api_key):
+    async def test_network_error_with_retry(self, httpx_mock: HTTPXMock, register_mock, client):
         """Test network error triggers retry."""
         # First request fails with network error
         httpx_mock.add_exception(httpx.NetworkError("Connection failed"))
 
         # Second request succeeds
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[],
-            status_code=200,
-        )
+        register_mock("/search", [])
 
-        async with PostCrawlClient(api_key=api_key, retry_delay=0.1) as client:
-            results = await client.search(
-                social_platforms=["reddit"], query="test", results=10, page=1
-            )
+        results = await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
 
         assert results == []
 
@@ -329,40 +408,65 @@ class TestNetworkAndRetry:
     async def test_network_error_max_retries(self, httpx_mock: HTTPXMock, api_key):
         """Test network error after max retries."""
         # All requests fail
-        for _ in range(4):  # 1 initial + 3 retries
-            httpx_mock.add_exception(httpx.NetworkError("Connection failed"))
+        httpx_mock.add_exception(httpx.NetworkError("Connection failed"), is_reusable=True)
 
-        async with PostCrawlClient(api_key=api_key, max_retries=3, retry_delay=0.01) as client:
+        async with PostCrawlClient(api_key=api_key, max_retries=3, retry_delay=0) as client:
             with pytest.raises(NetworkError) as exc_info:
                 await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
 
             assert "Network error" in str(exc_info.value)
 
+        assert len(httpx_mock.get_requests()) == 4  # 1 initial + 3 retries
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_zero_does_not_sleep(
+        self, httpx_mock: HTTPXMock, api_key, monkeypatch
+    ):
+        """Test retry_delay=0 retries without sleeping."""
+        httpx_mock.add_exception(httpx.NetworkError("Connection failed"))
+        httpx_mock.add_response(json=[])
+
+        async def fail_sleep(delay):
+            raise AssertionError(f"unexpected sleep({delay})")
+
+        monkeypatch.setattr("postcrawl.client.asyncio.sleep", fail_sleep)
+
+        async with PostCrawlClient(api_key=api_key, retry_delay=0) as client:
+            results = await client.search(
+                social_platforms=["reddit"], query="test", results=10, page=1
+            )
+
+        assert results == []
+
+    def test_backoff_delay_bounds(self):
+        """Test backoff delays stay between the base and the cap."""
+        assert _backoff_delay(0, 5.0) == 0
+        assert _backoff_delay(1.0, 0.0) == 1.0
+
+        previous = 0.0
+        for _ in range(20):
+            delay = _backoff_delay(1.0, previous)
+            assert 1.0 <= delay <= min(DEFAULT_MAX_RETRY_DELAY, max(1.0, previous * 3))
+            previous = delay
+
     @pytest.mark.asyncio
-    async def test_timeout_error(self, httpx_mock: HTTPXMock, api_key):
+    async def test_timeout_error(self, httpx_mock: HTTPXMock, client):
         """Test timeout error handling."""
         httpx_mock.add_exception(httpx.TimeoutException("Request timed out"))
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(TimeoutError) as exc_info:
-                await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        with pytest.raises(TimeoutError) as exc_info:
+            await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
 
-            assert isinstance(exc_info.value.original_error, httpx.TimeoutException)
+        assert isinstance(exc_info.value.original_error, httpx.TimeoutException)
 
 
 class TestContextManager:
     """Test context manager functionality."""
 
+    @pytest.mark.endpoint("/search")
     @pytest.mark.asyncio
-    async def test_context_manager(self, httpx_mock: HTTPXMock, api_key):
+    async def test_context_manager(self, api_key):
         """Test client works as async context manager."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json=[],
-            status_code=200,
-        )
-
         async with PostCrawlClient(api_key=api_key) as client:
             assert client._client is None  # Client created on demand
             await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
@@ -385,84 +489,76 @@ class TestContextManager:
         await client.close()
         assert client._client is None
 
-
-class TestRateLimitInfo:
-    """Test rate limit information tracking."""
-
     @pytest.mark.asyncio
-    async def test_rate_limit_headers(
-        self, httpx_mock: HTTPXMock, api_key, mock_rate_limit_headers
-    ):
-        """Test rate limit headers are properly parsed."""
+    async def test_http_client_reused_across_requests(self, httpx_mock: HTTPXMock, client):
+        """Test the same connection pool serves consecutive requests."""
         httpx_mock.add_response(
             method="POST",
-            url="https://edge.postcrawl.com/v1/search",
+            url=API_URLS["/search"],
             json=[],
             status_code=200,
-            headers=mock_rate_limit_headers,
+            is_reusable=True,
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        first = client._client
+        await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        assert first is not None
+        assert client._client is first
+
+
+class TestRateLimitInfo:
+    """Test rate limit information tracking."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers(self, register_mock, client, mock_rate_limit_headers):
+        """Test rate limit headers are properly parsed."""
+        register_mock("/search", [], headers=mock_rate_limit_headers)
 
-            assert client.rate_limit_info["limit"] == 200
-            assert client.rate_limit_info["remaining"] == 150
-            assert client.rate_limit_info["reset"] == 1703725200
+        await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+
+        assert client.rate_limit_info["limit"] == 200
+        assert client.rate_limit_info["remaining"] == 150
+        assert client.rate_limit_info["reset"] == 1703725200
 
 
 class TestErrorResponseHandling:
     """Test various error response handling."""
 
     @pytest.mark.asyncio
-    async def test_malformed_error_response(self, httpx_mock: HTTPXMock, api_key):
+    async def test_malformed_error_response(self, httpx_mock: HTTPXMock, client):
         """Test handling of malformed error responses."""
         httpx_mock.add_response(
             method="POST",
-            url="https://edge.postcrawl.com/v1/search",
+            url=API_URLS["/search"],
             text="Internal Server Error",
             status_code=500,
         )
 
-        async with PostCrawlClient(api_key=api_key) as client:
-            with pytest.raises(APIError) as exc_info:
-                await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
+        with pytest.raises(APIError) as exc_info:
+            await client.search(social_platforms=["reddit"], query="test", results=10, page=1)
 
-            assert exc_info.value.status_code == 500
-            assert "Internal Server Error" in str(exc_info.value)
+        assert exc_info.value.status_code == 500
+        assert "Internal Server Error" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_validation_error_with_details(self, httpx_mock: HTTPXMock, api_key):
-        """Test validation error with field details."""
-        httpx_mock.add_response(
-            method="POST",
-            url="https://edge.postcrawl.com/v1/search",
-            json={
-                "error": "validation_error",
-                "message": "Validation failed",
-                "request_id": "req_val_123",
-                "details": [
-                    {
-                        "field": "results",
-                        "code": "invalid_value",
-                        "message": "Must be between 1 and 100",
-                    }
-                ],
-            },
-            status_code=422,
-        )
-
-        async with PostCrawlClient(api_key=api_key) as client:
-            # First ensure the request doesn't fail client-side validation
-            # by using valid parameters that the server will reject
-            with pytest.raises(ValidationError) as exc_info:
-                await client.search(
-                    social_platforms=["reddit"],
-                    query="test",
-                    results=50,  # Valid for client, server will reject
-                    page=1,
-                )
-
-            assert exc_info.value.status_code == 422
-            assert len(exc_info.value.details) == 1
-            assert exc_info.value.details[0].field == "results"
-            assert exc_info.value.details[0].message == "Must be between 1 and 100"
+    @pytest.mark.parametrize(
+        "status,body,headers,exc_cls,expected",
+        HTTP_ERROR_CASES,
+        ids=[case[3].__name__ for case in HTTP_ERROR_CASES],
+    )
+    async def test_http_error(
+        self, register_mock, client, status, body, headers, exc_cls, expected
+    ):
+        """Test each API error status is raised as its exception type."""
+        register_mock("/search", body, status=status, headers=headers)
+
+        # Valid parameters for the client; the mocked server rejects them
+        with pytest.raises(exc_cls) as exc_info:
+            await client.search(social_platforms=["reddit"], query="test", results=50, page=1)
+
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == body["message"]
+        assert exc_info.value.request_id == body["request_id"]
+        for name, value in expected.items():
+            assert getattr(exc_info.value, name) == value
@@ -2,26 +2,48 @@
 Tests for PostCrawl type definitions and validation.
 """
 
+import json
+
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from postcrawl.types import (
+    _EXTRACT_REQUEST_ADAPTER,
+    _EXTRACT_RESPONSE_ADAPTER,
+    _SEARCH_REQUEST_ADAPTER,
+    _SEARCH_RESPONSE_ADAPTER,
     ErrorDetail,
     ErrorResponse,
     ExtractedPost,
     ExtractRequest,
-    RedditComment,
     RedditPost,
     SearchAndExtractRequest,
     SearchRequest,
     SearchResult,
     SocialPost,
-    TiktokComment,
     TiktokPost,
     is_reddit_post,
     is_tiktok_post,
 )
 
+_SEARCH_DATA = {"social_platforms": ["reddit"], "query": "python", "results": 10, "page": 1}
+
+# Payloads each request model must reject, validated through the client's shared adapters
+BAD_EXTRACT_REQUESTS = [
+    pytest.param({}, id="missing_urls"),
+    pytest.param({"urls": []}, id="empty_urls"),
+    pytest.param({"urls": "https://www.reddit.com/r/test/"}, id="urls_not_list"),
+    pytest.param({"urls": ["not-a-valid-url"]}, id="invalid_url"),
+    pytest.param({"urls": ["https://localhost:abc"]}, id="non_numeric_port"),
+    pytest.param({"urls": ["https://[::1"]}, id="unbalanced_ipv6"),
+]
+BAD_SEARCH_REQUESTS = [
+    pytest.param({**_SEARCH_DATA, "query": ""}, id="empty_query"),
+    pytest.param({**_SEARCH_DATA, "query": "   "}, id="whitespace_query"),
+    pytest.param({**_SEARCH_DATA, "social_platforms": []}, id="no_platforms"),
+    pytest.param({**_SEARCH_DATA, "social_platforms": ["facebook"]}, id="unknown_platform"),
+]
+
 
 class TestRequestTypes:
     """Test request type validation."""
@@ -44,17 +66,20 @@ class TestRequestTypes:
         assert request.include_comments is None
         assert request.response_mode is None
 
-    def test_extract_request_empty_urls(self):
-        """Test ExtractRequest with empty URLs."""
+    @pytest.mark.parametrize("payload", BAD_EXTRACT_REQUESTS)
+    def test_extract_request_rejected(self, payload):
+        """Test ExtractRequest rejects invalid payloads."""
         with pytest.raises(PydanticValidationError):
-            ExtractRequest(urls=[])
+            _EXTRACT_REQUEST_ADAPTER.validate_python(payload)
 
     def test_extract_request_too_many_urls(self):
-        """Test ExtractRequest with too many URLs."""
+        """Test ExtractRequest rejects too many URLs before validating any of them."""
         urls = [f"https://example.com/{i}" for i in range(101)]
-        with pytest.raises(PydanticValidationError):
+        with pytest.raises(PydanticValidationError) as exc_info:
             ExtractRequest(urls=urls)
 
+        assert [error["type"] for error in exc_info.value.errors()] == ["too_long"]
+
     def test_extract_request_invalid_url(self):
         """Test ExtractRequest with invalid URL format."""
         with pytest.raises(PydanticValidationError) as exc_info:
@@ -63,6 +88,43 @@ class TestRequestTypes:
         errors = exc_info.value.errors()
         assert any("URL" in str(e) for e in errors)
 
+    def test_extract_request_deduplicates_urls(self):
+        """Test ExtractRequest drops duplicate URLs, keeping the first occurrence."""
+        request = ExtractRequest(
+            urls=[
+                "https://www.reddit.com/r/b/comments/2/",
+                "https://www.reddit.com/r/a/comments/1/",
+                "https://www.reddit.com/r/b/comments/2/",
+            ]
+        )
+        assert request.urls == [
+            "https://www.reddit.com/r/b/comments/2/",
+            "https://www.reddit.com/r/a/comments/1/",
+        ]
+
+    @pytest.mark.parametrize(
+        "url", ["http://x", "https://[::1]:8080/post", "http://localhost:8787/r/test/"]
+    )
+    def test_extract_request_urls_outside_fast_path(self, url):
+        """Test valid URLs the fast-path regex doesn't match are checked by HttpUrl."""
+        assert ExtractRequest(urls=[url]).urls == [url]
+
+    def test_extract_request_duplicates_do_not_count_towards_limit(self):
+        """Test duplicates are dropped before the 100 URL limit is checked."""
+        url = "https://www.reddit.com/r/a/comments/1/"
+        assert ExtractRequest(urls=[url] * 101).urls == [url]
+
+    def test_extract_request_strict_urls(self, monkeypatch):
+        """Test that strict_urls opts in to full HttpUrl parsing."""
+        url = "https://example.com:99999/"
+        assert ExtractRequest(urls=[url]).urls == [url]
+
+        monkeypatch.setattr(ExtractRequest, "strict_urls", True)
+        with pytest.raises(PydanticValidationError) as exc_info:
+            ExtractRequest(urls=[url])
+
+        assert "Invalid URL format" in str(exc_info.value)
+
     def test_search_request_valid(self):
         """Test valid SearchRequest."""
         request = SearchRequest(
@@ -73,31 +135,32 @@ class TestRequestTypes:
         assert request.results == 50
         assert request.page == 2
 
-    def test_search_request_empty_query(self):
-        """Test SearchRequest with empty query."""
+    @pytest.mark.parametrize("payload", BAD_SEARCH_REQUESTS)
+    def test_search_request_rejected(self, payload):
+        """Test SearchRequest rejects a blank query and empty or unknown platforms."""
         with pytest.raises(PydanticValidationError):
-            SearchRequest(social_platforms=["reddit"], query="", results=10, page=1)
+            _SEARCH_REQUEST_ADAPTER.validate_python(payload)
 
-    def test_search_request_whitespace_query(self):
-        """Test SearchRequest with whitespace-only query."""
-        with pytest.raises(PydanticValidationError):
-            SearchRequest(social_platforms=["reddit"], query="   ", results=10, page=1)
+    def test_search_request_query_stripped(self):
+        """Test SearchRequest strips surrounding whitespace from the query."""
+        request = SearchRequest(social_platforms=["reddit"], query="  python  ", results=10, page=1)
+        assert request.query == "python"
 
-    def test_search_request_invalid_results(self):
-        """Test SearchRequest with invalid results count."""
-        # Generated types don't have built-in validation for results range
-        # These will succeed with the generated types
-        request1 = SearchRequest(social_platforms=["reddit"], query="test", results=0, page=1)
-        assert request1.results == 0
+    def test_search_request_adapter(self):
+        """Test the shared request adapter builds the same model as the constructor."""
+        request = _SEARCH_REQUEST_ADAPTER.validate_python(_SEARCH_DATA)
 
-        request2 = SearchRequest(social_platforms=["reddit"], query="test", results=101, page=1)
-        assert request2.results == 101
+        assert isinstance(request, SearchRequest)
+        assert request == SearchRequest(**_SEARCH_DATA)
 
-    def test_search_request_invalid_page(self):
-        """Test SearchRequest with invalid page number."""
-        # Generated types don't have built-in validation for page > 0
-        request = SearchRequest(social_platforms=["reddit"], query="test", results=10, page=0)
-        assert request.page == 0
+    @pytest.mark.parametrize(
+        "field,value", [("results", 0), ("results", 101), ("page", 0)], ids=str
+    )
+    def test_search_request_out_of_range(self, field, value):
+        """Test SearchRequest accepts out-of-range results and page values."""
+        # Generated types don't validate the results range or page > 0; the API does
+        request = SearchRequest(**{**_SEARCH_DATA, field: value})
+        assert getattr(request, field) == value
 
     def test_search_and_extract_request_valid(self):
         """Test valid SearchAndExtractRequest."""
@@ -204,6 +267,22 @@ class TestResponseTypes:
         assert post.is_tiktok_post() is True
         assert post.error is None
 
+    def test_extracted_post_raw_follows_source(self, mock_extract_response):
+        """Test raw data is validated with the model matching the source."""
+        reddit_post = ExtractedPost.model_validate(mock_extract_response[0])
+        tiktok_post = ExtractedPost.model_validate(mock_extract_response[1])
+
+        assert isinstance(reddit_post.raw, RedditPost)
+        assert isinstance(tiktok_post.raw, TiktokPost)
+
+    def test_extracted_post_raw_source_mismatch(self, mock_extract_response):
+        """Test raw data that does not match its source still validates as a platform type."""
+        data = {**mock_extract_response[0], "source": "tiktok"}
+        post = ExtractedPost.model_validate(data)
+
+        assert isinstance(post.raw, RedditPost)
+        assert post.is_tiktok_post() is False
+
     def test_extracted_post_with_error(self):
         """Test ExtractedPost with extraction error."""
         post = ExtractedPost(
@@ -220,7 +299,7 @@ class TestResponseTypes:
         assert post.is_tiktok_post() is False
 
     def test_extracted_post_extra_fields(self):
-        """Test ExtractedPost allows extra fields."""
+        """Test ExtractedPost ignores unknown fields."""
         post = ExtractedPost(
             url="https://example.com/post",
             source="reddit",
@@ -228,15 +307,83 @@ class TestResponseTypes:
             markdown="# Test Post",
             error=None,
             title="Extra Title",
-            author="Extra Author",
-            content="Extra Content",
-            extra_field="Should be allowed",
+            extra_field="Should be ignored",
+        )
+
+        assert post.markdown == "# Test Post"
+        # extra="ignore" stores nothing for unknown fields, so there's no extras dict at all
+        assert post.__pydantic_extra__ is None
+        assert "title" not in post.__dict__ and "extra_field" not in post.__dict__
+
+    def test_extracted_post_frozen(self):
+        """Test ExtractedPost instances are immutable."""
+        post = ExtractedPost(url="https://example.com/post", source="reddit")
+
+        with pytest.raises(PydanticValidationError):
+            post.url = "https://example.com/other"
+
+    def test_extracted_post_preview(self, mock_extract_response):
+        """Test preview truncates the description and is included when serialized."""
+        long_post = {**mock_extract_response[1]}
+        long_post["raw"] = {**long_post["raw"], "description": "x" * 200}
+        post = ExtractedPost.model_validate(long_post)
+
+        assert post.preview == "x" * 150 + "..."
+        assert post.model_dump()["preview"] == post.preview
+
+        # Follows raw on copies instead of keeping the original post's value
+        copy = post.model_copy(update={"raw": None})
+        assert copy.preview == ""
+        assert copy.model_dump()["preview"] == ""
+
+        short = ExtractedPost.model_validate(mock_extract_response[0])
+        assert short.preview == "This is the post content."
+        assert ExtractedPost.model_validate(mock_extract_response[2]).preview == ""
+
+    def test_extracted_post_platform_checks(self, mock_extract_response):
+        """Test the platform checks agree with raw's type, including on copies."""
+        reddit, tiktok, failed = (
+            ExtractedPost.model_validate(item) for item in mock_extract_response
         )
 
-        assert post.title == "Extra Title"
-        assert post.author == "Extra Author"
-        assert post.content == "Extra Content"
-        assert hasattr(post, "extra_field")
+        assert reddit.get_reddit_post() is reddit.raw
+        assert reddit.get_tiktok_post() is None
+        assert tiktok.get_tiktok_post() is tiktok.raw
+        assert tiktok.get_reddit_post() is None
+        assert not failed.is_reddit_post() and not failed.is_tiktok_post()
+
+        copy = reddit.model_copy(update={"raw": None, "source": "tiktok"})
+        assert not copy.is_reddit_post() and not copy.is_tiktok_post()
+        assert copy.get_reddit_post() is None
+
+    def test_search_response_adapter(self, mock_search_response):
+        """Test the shared list adapter validates search responses in one call."""
+        results = _SEARCH_RESPONSE_ADAPTER.validate_python(mock_search_response)
+
+        assert len(results) == 2
+        assert all(isinstance(result, SearchResult) for result in results)
+        assert results[0].image_url == "https://preview.redd.it/ml-basics.jpg"
+
+    def test_extract_response_adapter(self, mock_extract_response):
+        """Test the shared list adapter validates extract responses in one call."""
+        posts = _EXTRACT_RESPONSE_ADAPTER.validate_python(mock_extract_response)
+
+        assert len(posts) == 3
+        assert all(isinstance(post, ExtractedPost) for post in posts)
+        assert isinstance(posts[0].raw, RedditPost)
+        assert isinstance(posts[1].raw, TiktokPost)
+        assert posts[2].raw is None
+
+    def test_extract_response_adapter_json(self, mock_extract_response):
+        """Test the adapter parses raw response bytes the way the client receives them."""
+        body = json.dumps(mock_extract_response).encode()
+        posts = _EXTRACT_RESPONSE_ADAPTER.validate_json(body)
+
+        assert posts == _EXTRACT_RESPONSE_ADAPTER.validate_python(mock_extract_response)
+        assert posts[0].is_reddit_post() and posts[1].is_tiktok_post()
+        # Posts serialized in the API's field names (plus the computed preview) parse back equal
+        dumped = _EXTRACT_RESPONSE_ADAPTER.dump_json(posts, by_alias=True)
+        assert _EXTRACT_RESPONSE_ADAPTER.validate_json(dumped) == posts
 
     def test_social_post_legacy(self):
         """Test legacy SocialPost model."""
@@ -259,21 +406,6 @@ class TestResponseTypes:
         assert post.social_source == "reddit"
 
 
-class TestPlatformSpecificTypes:
-    """Test platform-specific type models."""
-
-    def test_platform_types_exist(self):
-        """Test that platform-specific types are imported and available."""
-        # Just verify the types exist and can be imported
-        assert RedditPost is not None
-        assert RedditComment is not None
-        assert TiktokPost is not None
-        assert TiktokComment is not None
-
-        # These are auto-generated types, so we don't test their exact structure
-        # as it can change when the API changes
-
-
 class TestTypeGuards:
     """Test type guard functions."""
 
@@ -359,3 +491,13 @@ class TestErrorTypes:
         assert response.message == "Internal server error"
         assert response.request_id is None
         assert response.details is None
+
+    def test_error_models_frozen(self, mock_error_response):
+        """Test error models are immutable and hashable."""
+        response = ErrorResponse.model_validate(mock_error_response)
+
+        with pytest.raises(PydanticValidationError):
+            response.message = "changed"
+        with pytest.raises(PydanticValidationError):
+            response.details[0].field = "changed"
+        assert hash(response.details[0]) == hash(ErrorDetail(**mock_error_response["details"][0]))